@@ -1,4 +1,5 @@
 """This module contains the functions to interact with the Dynatrace API."""
+import logging
 import os
 import time
 from functools import wraps
@@ -6,10 +7,14 @@ import requests
 
 from src.utils import secrets_manager
 
+logger = logging.getLogger(__name__)
+
 class DynatraceClient:
     """A client for interacting with the Dynatrace API."""
 
-    def __init__(self):
+    def __init__(self, http=requests):
+        # The HTTP transport; anything with a requests-compatible post() can stand in
+        self._http = http
         # Try to get from secrets manager first, then fall back to environment variables
         self.dynatrace_api_url = secrets_manager.get_secret_value("DYNATRACE_API_URL") or os.environ.get("DYNATRACE_API_URL")
         self.dynatrace_api_token = secrets_manager.get_secret_value("DYNATRACE_API_TOKEN") or os.environ.get("DYNATRACE_API_TOKEN")
@@ -25,12 +30,12 @@ class DynatraceClient:
         events_endpoint = f"{self.dynatrace_api_url}/api/v2/events/ingest"
 
         try:
-            response = requests.post(events_endpoint, headers=headers, json=event_payload, timeout=10)
+            response = self._http.post(events_endpoint, headers=headers, json=event_payload, timeout=10)
             response.raise_for_status()
-            print(f"Successfully sent event to Dynatrace: {event_payload.get('title')}")
+            logger.info("Successfully sent event to Dynatrace: %s", event_payload.get('title'))
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error sending event to Dynatrace: {e}")
+            logger.error("Error sending event to Dynatrace: %s", e)
             return None
 
 def trace_function(func):
@@ -70,7 +75,7 @@ def trace_function(func):
             return result
         except Exception as e:
             duration = round((time.time() - start_time) * 1000, 2)
-            print(f"Function {func_name} failed with error: {e}")
+            logger.error("Function %s failed with error: %s", func_name, e)
 
             fail_event = {
                 "eventType": "CUSTOM_ERROR",
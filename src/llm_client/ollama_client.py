@@ -14,7 +14,6 @@ class OllamaClient(LLMClient):
         self.model = model or os.environ.get("OLLAMA_MODEL", "codellama:13b")
 
     def call(self, messages, tools=None):
-        headers = {"Content-Type": "application/json"}
         payload = {
             "model": self.model,
             "messages": messages,
@@ -23,10 +22,15 @@ class OllamaClient(LLMClient):
         if tools:
             payload["tools"] = tools
 
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            self.api_endpoint, data=data, headers=headers, method='POST'
-        )
+        req = self._build_request(payload)
         with urllib.request.urlopen(req, timeout=15) as response:
             response_data = json.loads(response.read().decode('utf-8'))
             return response_data.get('message', {})
+
+    def _build_request(self, payload):
+        """Serializes the chat payload into a POST request for the API endpoint."""
+        headers = {"Content-Type": "application/json"}
+        data = json.dumps(payload).encode('utf-8')
+        return urllib.request.Request(
+            self.api_endpoint, data=data, headers=headers, method='POST'
+        )
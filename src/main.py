@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 import urllib.request
 import yaml
@@ -377,6 +378,8 @@ def lambda_handler(event, context):
     Unified Lambda handler that routes requests to appropriate handlers based on path.
     This enables container image deployment with a single function.
     """
+    # The Lambda runtime's root logger is at WARNING; let the clients' INFO records through
+    logging.getLogger().setLevel(logging.INFO)
     try:
         # Extract path from API Gateway event
         path = event.get('path', '')
@@ -1,8 +1,10 @@
 """This module contains the logic for the scaling suggestion engine."""
+import copy
 import os
 import json
 import sys
-from typing import Dict, Any, Optional
+import hashlib
+from typing import Dict, Any, Optional, MutableMapping
 from ..llm_client import OllamaClient, BringYourOwnLLMClient
 from ..mcp_client import DynatraceMCPClient, MockMCPClient
 from ..data_models import ScalingSuggestionContent
@@ -10,6 +12,9 @@ from ..data_models import ScalingSuggestionContent
 # Import the tools utility using absolute import
 from ..utils.llm_tools import create_scaling_tools_manager
 
+# Upper bound on LLM round-trips before falling back to the static suggestion
+MAX_LLM_TURNS = 5
+
 
 def _get_mcp_client():
     """Factory to get the configured MCP client."""
@@ -182,9 +187,9 @@ def _generate_static_suggestion(deployment_context, repo_name, config):
     
     return {"hpa": hpa_suggestion, "karpenter": karpenter_suggestion}
 
-def _run_ai_suggestion_workflow(app_context, deployment_context, config):
+def _run_ai_suggestion_workflow(app_context, deployment_context, config, llm_client=None):
     """Run the AI-powered suggestion workflow."""
-    llm_client = _get_llm_client()
+    llm_client = llm_client or _get_llm_client()
     mcp_client = _get_mcp_client()
     
     # Prepare context
@@ -203,8 +208,7 @@ def _run_ai_suggestion_workflow(app_context, deployment_context, config):
     messages = [{"role": "user", "content": _build_initial_prompt(target_entity, app_name, namespace)}]
     
     # Execute conversation loop
-    max_iterations = 5
-    for iteration in range(max_iterations):
+    for iteration in range(MAX_LLM_TURNS):
         try:
             # Get LLM response
             llm_response = llm_client.call(messages, tools)
@@ -219,7 +223,9 @@ def _run_ai_suggestion_workflow(app_context, deployment_context, config):
             # Execute tool calls
             for tool_call in llm_response["tool_calls"]:
                 function_name = tool_call['function']['name']
-                function_args = json.loads(tool_call['function']['arguments'])
+                # Some providers (e.g. Ollama) return arguments already parsed
+                arguments = tool_call['function']['arguments']
+                function_args = arguments if isinstance(arguments, dict) else json.loads(arguments)
                 
                 # Execute tool using tools manager
                 try:
@@ -253,7 +259,13 @@ def _run_ai_suggestion_workflow(app_context, deployment_context, config):
     # If we reach here, AI workflow didn't produce a valid suggestion
     return None
 
-def get_suggestion(config, app_context, deployment_context):
+def _suggestion_cache_key(config, app_context, deployment_context):
+    """Builds a stable cache key from the configuration and the application and deployment contexts."""
+    payload = json.dumps((config, app_context, deployment_context), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def get_suggestion(config, app_context, deployment_context, llm_client=None,
+                   cache: Optional[MutableMapping[str, Dict[str, Any]]] = None):
     """
     Generates a scaling suggestion using AI-first approach with static fallback.
     
@@ -261,6 +273,9 @@ def get_suggestion(config, app_context, deployment_context):
         config: Configuration dictionary from AppConfig
         app_context: Application context (name, namespace, etc.)
         deployment_context: Deployment context (environment, etc.)
+        llm_client: LLM client to converse with; defaults to the one selected by LLM_CLIENT_TYPE
+        cache: Optional mapping of AI suggestions, keyed on the config and the app and
+            deployment contexts; callers get copies, never the cached dicts themselves
     
     Returns:
         dict: Scaling suggestion with source information
@@ -279,11 +294,22 @@ def get_suggestion(config, app_context, deployment_context):
             'suggestion_source': 'static'
         }
     
+    # Reuse an earlier AI suggestion for the same config and contexts
+    cache_key = None
+    if cache is not None:
+        cache_key = _suggestion_cache_key(config, app_context, deployment_context)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print("Using cached AI suggestion.")
+            return copy.deepcopy(cached)
+    
     # Try AI-powered suggestion
     try:
-        ai_result = _run_ai_suggestion_workflow(app_context, deployment_context, config)
+        ai_result = _run_ai_suggestion_workflow(app_context, deployment_context, config, llm_client)
         if ai_result:
             print("AI suggestion generated successfully.")
+            if cache_key is not None:
+                cache[cache_key] = copy.deepcopy(ai_result)
             return ai_result
     except Exception as e:
         print(f"AI suggestion workflow failed: {e}")
@@ -1,7 +1,6 @@
 """This module contains functions for interacting with AWS Secrets Manager."""
 import os
 import json
-import boto3
 
 CACHED_SECRETS = None
 
@@ -18,6 +17,9 @@ def get_secret(secret_name):
         return CACHED_SECRETS
 
     print(f"Fetching secret '{secret_name}' from AWS Secrets Manager...")
+    # Imported on first fetch so modules that only reach this one through the
+    # connectors (or never set SECRETS_MANAGER_NAME) don't pay for loading boto3
+    import boto3
     client = boto3.client('secretsmanager')
 
     try:
@@ -6,6 +6,7 @@ to enable performance testing and local development.
 """
 
 import json
+import logging
 import os
 from flask import Flask, request, jsonify
 from .main import lambda_handler
@@ -87,6 +88,7 @@ def gate_endpoint():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8000))
     debug = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    logging.basicConfig(level=logging.INFO)
     
     print(f"Starting SRE Agent web server on port {port}")
     print(f"Debug mode: {debug}")
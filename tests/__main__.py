@@ -0,0 +1,14 @@
+"""Run the test suite through pytest: ``python -m tests [pytest args]``.
+
+The former runner scripts are plain pytest modules now; with no arguments this runs
+everything under tests/ with the options from pytest.ini. The suite is spread across
+CPU cores with pytest-xdist; pass ``-n0`` to run it serially.
+"""
+import os
+import sys
+
+import pytest
+
+if __name__ == '__main__':
+    args = sys.argv[1:] or [os.path.dirname(os.path.abspath(__file__))]
+    sys.exit(pytest.main(['-n', 'auto', *args]))
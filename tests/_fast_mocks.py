@@ -0,0 +1,57 @@
+"""Lightweight stand-ins for unittest.mock helpers and MagicMock responses on hot test setup paths."""
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def env(**values):
+    """Set environment variables for the block and restore their previous state afterwards.
+
+    Equivalent to ``patch.dict(os.environ, values)`` for the keys given, without a
+    ``_patch`` object or a copy of the whole environment.
+    """
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class UrlopenResponse:
+    """The slice of a urlopen response the LLM clients use: a context manager with read()."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def read(self):
+        return self._body
+
+
+class JsonResponse:
+    """The slice of a requests.Response the clients use: status_code, json() and raise_for_status().
+
+    raise_for_status() raises ``error`` when one is given.
+    """
+
+    def __init__(self, payload, status_code=200, error=None):
+        self._payload = payload
+        self.status_code = status_code
+        self._error = error
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self._error is not None:
+            raise self._error
@@ -0,0 +1,13 @@
+"""dumps/loads for test payloads: orjson when installed, the stdlib json module otherwise."""
+import json
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    dumps = json.dumps
+    loads = json.loads
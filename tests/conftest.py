@@ -0,0 +1,48 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+
+# Expose src/ for tests that import its top-level modules directly, and the Harness
+# example, a standalone script rather than a package, for plain imports. This runs once
+# per worker at conftest import; the guard keeps a re-import from stacking duplicates.
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+_HARNESS_EXAMPLE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'examples', 'harness-integration'))
+for _path in (_SRC_DIR, _HARNESS_EXAMPLE_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+@pytest.fixture(scope="session")
+def sre_modules():
+    """The scaling engine entry points and client classes, imported on first use."""
+    from src.suggestion_engines import scaling_engine
+    from src.suggestion_engines.scaling_engine import get_suggestion, _get_llm_client, _get_mcp_client
+    from src.mcp_client.dynatrace_mcp_client import DynatraceMCPClient
+    from src.mcp_client.mock_mcp_client import MockMCPClient
+    from src.llm_client.ollama_client import OllamaClient
+    from src.llm_client.bring_your_own_llm_client import BringYourOwnLLMClient
+    from src.data_models import ScalingSuggestion
+
+    return SimpleNamespace(
+        scaling_engine=scaling_engine,
+        get_suggestion=get_suggestion,
+        get_llm_client=_get_llm_client,
+        get_mcp_client=_get_mcp_client,
+        DynatraceMCPClient=DynatraceMCPClient,
+        MockMCPClient=MockMCPClient,
+        OllamaClient=OllamaClient,
+        BringYourOwnLLMClient=BringYourOwnLLMClient,
+        ScalingSuggestion=ScalingSuggestion,
+    )
+
+
+@pytest.fixture(scope="session")
+def sre_main():
+    """The Lambda handler module, imported on first use."""
+    from src import main
+
+    return main
@@ -0,0 +1,12 @@
+"""Constants shared by the integration tests and their conftest fixtures."""
+
+# Credentials for every connector, served to the clients via the environment.
+CONNECTOR_ENV = {
+    'DYNATRACE_API_URL': 'https://test.dynatrace.com',
+    'DYNATRACE_API_TOKEN': 'test_token',
+    'SONAR_API_URL': 'https://sonarqube.example.com',
+    'SONAR_API_TOKEN': 'test_sonar_token',
+    'WIZ_API_URL': 'https://api.wiz.io',
+    'WIZ_API_TOKEN': 'test_wiz_token',
+    'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/services/test/webhook/url',
+}
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+# Import the connectors (and their requests/secrets_manager dependencies) once per
+# worker so the test modules' own imports are sys.modules cache hits.
+from src.connectors import dynatrace_client, sonarqube_client, wiz_client, slack_client
+from tests.integration._fakes import CONNECTOR_ENV
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """Application config with AI enabled and a prod scaling profile."""
+    return {
+        'features': {
+            'enable_ai_shadow_analyst': True
+        },
+        'scaling_suggestions': {
+            'environments': {
+                'prod': {
+                    'hpa': {
+                        'min_replicas': 2,
+                        'max_replicas': 10,
+                        'cpu_utilization_target': 70
+                    },
+                    'karpenter': {
+                        'capacity_type': 'spot'
+                    }
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    """Module-scoped counterpart of the built-in monkeypatch fixture."""
+    mp = pytest.MonkeyPatch()
+    yield mp
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
+def connector_env(monkeypatch_module):
+    """Install connector credentials and resolve secrets straight from the environment."""
+    for key, value in CONNECTOR_ENV.items():
+        monkeypatch_module.setenv(key, value)
+    monkeypatch_module.setattr('src.utils.secrets_manager.get_secret_value', os.environ.get)
+
+
+@pytest.fixture(scope="module")
+def _requests_mock():
+    """A responses adapter mounted once for the module; routes are added per test."""
+    import responses
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def http(_requests_mock):
+    """The module's responses adapter, with routes and recorded calls cleared after each test."""
+    yield _requests_mock
+    _requests_mock.reset()
+
+
+# Connector clients are built once per module against CONNECTOR_ENV; tests that
+# exercise missing configuration construct their own.
+@pytest.fixture(scope="module")
+def dynatrace_connector(connector_env):
+    return dynatrace_client.DynatraceClient()
+
+
+@pytest.fixture(scope="module")
+def sonarqube_connector(connector_env):
+    return sonarqube_client.SonarQubeClient()
+
+
+@pytest.fixture(scope="module")
+def wiz_connector(connector_env):
+    return wiz_client.WizClient()
+
+
+@pytest.fixture(scope="module")
+def slack_connector(connector_env):
+    return slack_client.SlackClient()
@@ -1,298 +1,220 @@
-import unittest
-import os
+import json
+import re
+from collections import Counter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 import requests
-from unittest.mock import patch, MagicMock
+import responses
 import pytest
 from src.connectors.dynatrace_client import DynatraceClient
 from src.connectors.sonarqube_client import SonarQubeClient
 from src.connectors.wiz_client import WizClient
 from src.connectors.slack_client import SlackClient
+from tests.integration._fakes import CONNECTOR_ENV
+
+# Keep the module on one worker so its module-scoped clients and responses adapter
+# are built once
+pytestmark = [pytest.mark.usefixtures("connector_env"), pytest.mark.xdist_group("connectors")]
+
+# Exact endpoint URLs, so route lookup is a string comparison rather than a regex scan
+_DYNATRACE_EVENTS_URL = f"{CONNECTOR_ENV['DYNATRACE_API_URL']}/api/v2/events/ingest"
+_SONAR_STATUS_URL = f"{CONNECTOR_ENV['SONAR_API_URL']}/api/qualitygates/project_status"
+_WIZ_IMAGES_URL = f"{CONNECTOR_ENV['WIZ_API_URL']}/api/v1/images"
+_SLACK_WEBHOOK_URL = CONNECTOR_ENV['SLACK_WEBHOOK_URL']
+
+# Healthy responses for every connector, keyed on the host each one calls; bodies are
+# serialized once and served from route callbacks
+_HEALTHY_ROUTES = {
+    urlparse(url).hostname: (method, url, json.dumps(payload))
+    for method, url, payload in (
+        (responses.POST, _DYNATRACE_EVENTS_URL, {'eventIngestResults': [{'status': 'OK'}]}),
+        (responses.GET, _SONAR_STATUS_URL, {'projectStatus': {'status': 'OK'}}),
+        (responses.GET, _WIZ_IMAGES_URL, {'count': 0}),
+        (responses.POST, _SLACK_WEBHOOK_URL, {'ok': True}),
+    )
+}
+
+_DT_NOT_CONFIGURED = re.compile("Dynatrace API URL or Token not configured")
+_SQ_NOT_CONFIGURED = re.compile("SonarQube URL or Token not configured")
+_WIZ_NOT_CONFIGURED = re.compile("Wiz API URL or Token not configured")
+
+# Shared request/response payloads, read-only so tests cannot leak mutations into each
+# other. JSON encoders reject mappingproxy, so call sites pass a dict() copy.
+_DT_EVENT = MappingProxyType({
+    'eventType': 'CUSTOM_INFO',
+    'title': 'Test Event',
+    'entitySelector': 'type(CUSTOM_DEVICE)'
+})
+
+_SLACK_NOTIFICATION = MappingProxyType({
+    'blocks': [
+        {
+            'type': 'section',
+            'text': {
+                'type': 'mrkdwn',
+                'text': 'Test notification'
+            }
+        }
+    ]
+})
+
+_DT_RESP = MappingProxyType({'eventIngestResults': [{'status': 'OK', 'correlationId': 'test-correlation-id'}]})
+_SQ_RESP = MappingProxyType({'projectStatus': {'status': 'OK',
+                                               'conditions': [{'status': 'OK', 'metricKey': 'coverage',
+                                                               'actualValue': '85.5'}]}})
+_WIZ_RESP = MappingProxyType({'count': 3})
+_SLACK_RESP = MappingProxyType({'ok': True, 'message': {'ts': '1234567890.123456'}})
+
+# Result and request checks for CONNECTOR_CASES. Each asserts field by field so a
+# failure names the value that was wrong.
+def _check_dynatrace_result(result):
+    assert result is not None
+    ingest_result = result['eventIngestResults'][0]
+    assert ingest_result['status'] == 'OK'
+    assert 'correlationId' in ingest_result
+
+
+def _check_dynatrace_request(request):
+    assert request.headers['Authorization'] == 'Api-Token test_token'
+    assert json.loads(request.body) == _DT_EVENT
+
+
+def _check_sonarqube_result(result):
+    assert result['status'] == 'SUCCESS'
+    assert 'SonarQube Quality Gate passed' in result['message']
+
+
+def _check_sonarqube_request(request):
+    # Basic auth for ('test_sonar_token', '')
+    assert request.headers['Authorization'] == 'Basic dGVzdF9zb25hcl90b2tlbjo='
+
+
+def _check_wiz_result(result):
+    assert result['status'] == 'FAILURE'
+    assert 'critical vulnerabilities' in result['message']
+
+
+def _check_wiz_request(request):
+    assert request.headers['Authorization'] == 'Bearer test_wiz_token'
+
+
+def _check_slack_result(result):
+    assert result is not None
+    assert result['ok'] is True
+    assert 'ts' in result['message']
+
+
+def _check_slack_request(request):
+    assert json.loads(request.body) == _SLACK_NOTIFICATION
+
+
+# (client fixture, HTTP method, exact URL, JSON response, client call, result check, request check)
+CONNECTOR_CASES = [
+    (
+        'dynatrace_connector', responses.POST, _DYNATRACE_EVENTS_URL,
+        _DT_RESP,
+        lambda client: client.send_event(dict(_DT_EVENT)),
+        _check_dynatrace_result,
+        _check_dynatrace_request,
+    ),
+    (
+        'sonarqube_connector', responses.GET, _SONAR_STATUS_URL,
+        _SQ_RESP,
+        lambda client: client.get_quality_gate_status('test-project'),
+        _check_sonarqube_result,
+        _check_sonarqube_request,
+    ),
+    (
+        'wiz_connector', responses.GET, _WIZ_IMAGES_URL,
+        _WIZ_RESP,
+        lambda client: client.get_cve_status('test-artifact:v1.0.0'),
+        _check_wiz_result,
+        _check_wiz_request,
+    ),
+    (
+        'slack_connector', responses.POST, _SLACK_WEBHOOK_URL,
+        _SLACK_RESP,
+        lambda client: client.send_notification(dict(_SLACK_NOTIFICATION)),
+        _check_slack_result,
+        _check_slack_request,
+    ),
+]
 
 
 class TestConnectorIntegration:
 
-    def test_dynatrace_client_integration(self):
-        """Test Dynatrace client integration."""
-        mock_event_response = {
-            'eventIngestResults': [
-                {
-                    'status': 'OK',
-                    'correlationId': 'test-correlation-id'
-                }
-            ]
-        }
-        
-        with patch.dict(os.environ, {
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.post') as mock_post:
-                    mock_post.return_value.status_code = 200
-                    mock_post.return_value.json.return_value = mock_event_response
-                    
-                    client = DynatraceClient()
-                    
-                    test_event = {
-                        'eventType': 'CUSTOM_INFO',
-                        'title': 'Test Event',
-                        'entitySelector': 'type(CUSTOM_DEVICE)'
-                    }
-                    
-                    result = client.send_event(test_event)
-                    
-                    # Add type checking to handle potential None return
-                    assert result is not None
-                    assert result['eventIngestResults'][0]['status'] == 'OK'
-                    assert 'correlationId' in result['eventIngestResults'][0]
-                    
-                    # Verify the request was made correctly
-                    mock_post.assert_called_once()
-                    call_args = mock_post.call_args
-                    assert 'events/ingest' in call_args[0][0]
-                    assert call_args[1]['headers']['Authorization'] == 'Api-Token test_token'
-                    assert call_args[1]['json'] == test_event
-
-    def test_sonarqube_client_integration(self):
-        """Test SonarQube client integration."""
-        mock_quality_gate_response = {
-            'projectStatus': {
-                'status': 'OK',
-                'conditions': [
-                    {
-                        'status': 'OK',
-                        'metricKey': 'coverage',
-                        'actualValue': '85.5'
-                    }
-                ]
-            }
-        }
-        
-        with patch.dict(os.environ, {
-            'SONAR_API_URL': 'https://sonarqube.example.com',
-            'SONAR_API_TOKEN': 'test_sonar_token'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.get') as mock_get:
-                    mock_get.return_value.status_code = 200
-                    mock_get.return_value.json.return_value = mock_quality_gate_response
-                    
-                    client = SonarQubeClient()
-                    result = client.get_quality_gate_status('test-project')
-                    
-                    assert result['status'] == 'SUCCESS'
-                    assert 'SonarQube Quality Gate passed' in result['message']
-                    
-                    # Verify the request was made correctly
-                    mock_get.assert_called_once()
-                    call_args = mock_get.call_args
-                    assert 'qualitygates/project_status' in call_args[0][0]
-                    assert call_args[1]['auth'] == ('test_sonar_token', '')
-
-    def test_wiz_client_integration(self):
-        """Test Wiz client integration."""
-        mock_cve_response = {
-            'count': 3
-        }
-        
-        with patch.dict(os.environ, {
-            'WIZ_API_URL': 'https://api.wiz.io',
-            'WIZ_API_TOKEN': 'test_wiz_token'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.get') as mock_get:
-                    mock_get.return_value.status_code = 200
-                    mock_get.return_value.json.return_value = mock_cve_response
-                    
-                    client = WizClient()
-                    result = client.get_cve_status('test-artifact:v1.0.0')
-                    
-                    assert result['status'] == 'FAILURE'
-                    assert 'critical vulnerabilities' in result['message']
-                    
-                    # Verify the request was made correctly
-                    mock_get.assert_called_once()
-                    call_args = mock_get.call_args
-                    assert 'api/v1/images' in call_args[0][0]
-                    assert call_args[1]['headers']['Authorization'] == 'Bearer test_wiz_token'
-
-    def test_slack_client_integration(self):
-        """Test Slack client integration."""
-        mock_slack_response = {
-            'ok': True,
-            'message': {
-                'ts': '1234567890.123456'
-            }
-        }
-        
-        with patch.dict(os.environ, {
-            'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/services/test/webhook/url'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.post') as mock_post:
-                    mock_post.return_value.status_code = 200
-                    mock_post.return_value.json.return_value = mock_slack_response
-                    
-                    client = SlackClient()
-                    
-                    test_notification = {
-                        'blocks': [
-                            {
-                                'type': 'section',
-                                'text': {
-                                    'type': 'mrkdwn',
-                                    'text': 'Test notification'
-                                }
-                            }
-                        ]
-                    }
-                    
-                    result = client.send_notification(test_notification)
-                    
-                    # Add type checking to handle potential None return
-                    assert result is not None
-                    assert result['ok'] is True
-                    assert 'ts' in result['message']
-                    
-                    # Verify webhook was called
-                    mock_post.assert_called_once()
-                    call_args = mock_post.call_args
-                    assert 'hooks.slack.com' in call_args[0][0]
-
-    def test_connector_error_handling(self):
-        """Test error handling in connectors."""
-        with patch.dict(os.environ, {
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.post') as mock_post:
-                    # Simulate API error
-                    mock_post.return_value.status_code = 500
-                    mock_post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError('500 Server Error')
-                    
-                    client = DynatraceClient()
-                    
-                    test_event = {
-                        'eventType': 'CUSTOM_INFO',
-                        'title': 'Test Event'
-                    }
-                    
-                    # Should handle error gracefully
-                    result = client.send_event(test_event)
-                    
-                    # Should return None due to error
-                    assert result is None
-
-    def test_connector_configuration_validation(self):
+    @pytest.mark.parametrize("client_fixture, method, url, resp, call, check, check_request", CONNECTOR_CASES,
+                             ids=["dynatrace", "sonarqube", "wiz", "slack"])
+    def test_connector_integration(self, request, http, client_fixture, method, url, resp, call, check,
+                                   check_request):
+        """Test each connector against a mocked HTTP endpoint."""
+        http.add(method, url, json=dict(resp), status=200)
+
+        result = call(request.getfixturevalue(client_fixture))
+
+        check(result)
+
+        # Verify the request was made correctly
+        assert len(http.calls) == 1
+        check_request(http.calls[-1].request)
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("route", [
+        {'status': 500, 'json': {}},
+        {'body': requests.exceptions.Timeout('Request timed out')},
+        {'body': requests.exceptions.ConnectionError('Connection refused')},
+    ], ids=["http_error", "timeout", "connection_error"])
+    def test_dynatrace_error_paths(self, http, dynatrace_connector, route):
+        """Test that the Dynatrace connector handles request failures gracefully."""
+        http.add(responses.POST, _DYNATRACE_EVENTS_URL, **route)
+
+        result = dynatrace_connector.send_event(dict(_DT_EVENT))
+
+        # Should return None due to the error
+        assert result is None
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("client_cls, pattern", [
+        (DynatraceClient, _DT_NOT_CONFIGURED),
+        (SonarQubeClient, _SQ_NOT_CONFIGURED),
+        (WizClient, _WIZ_NOT_CONFIGURED),
+    ], ids=["dynatrace", "sonarqube", "wiz"])
+    def test_connector_configuration_validation(self, monkeypatch, client_cls, pattern):
         """Test connector configuration validation."""
-        # Test missing configuration
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with pytest.raises(ValueError, match="Dynatrace API URL or Token not configured"):
-                    DynatraceClient()
-        
-        # Test missing SonarQube config
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with pytest.raises(ValueError, match="SonarQube URL or Token not configured"):
-                    SonarQubeClient()
-        
-        # Test missing Wiz config
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with pytest.raises(ValueError, match="Wiz API URL or Token not configured"):
-                    WizClient()
-
-    def test_connector_timeout_handling(self):
-        """Test connector timeout handling."""
-        with patch.dict(os.environ, {
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.post') as mock_post:
-                    # Simulate timeout
-                    mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
-                    
-                    client = DynatraceClient()
-                    
-                    test_event = {
-                        'eventType': 'CUSTOM_INFO',
-                        'title': 'Test Event'
-                    }
-                    
-                    # Should handle error gracefully
-                    result = client.send_event(test_event)
-                    
-                    # Should return None due to timeout
-                    assert result is None
-
-    def test_multiple_connector_integration(self):
+        for key in CONNECTOR_ENV:
+            monkeypatch.delenv(key, raising=False)
+
+        with pytest.raises(ValueError, match=pattern):
+            client_cls()
+
+    @pytest.mark.slow
+    def test_multiple_connector_integration(self, http, dynatrace_connector, sonarqube_connector,
+                                            wiz_connector, slack_connector):
         """Test integration between multiple connectors."""
         # Mock responses for all connectors
-        mock_responses = {
-            'dynatrace': {'eventIngestResults': [{'status': 'OK'}]},
-            'sonarqube': {'projectStatus': {'status': 'OK'}},
-            'wiz': {'count': 0},
-            'slack': {'ok': True}
-        }
-        
-        with patch.dict(os.environ, {
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token',
-            'SONAR_API_URL': 'https://sonarqube.example.com',
-            'SONAR_API_TOKEN': 'test_sonar_token',
-            'WIZ_API_URL': 'https://api.wiz.io',
-            'WIZ_API_TOKEN': 'test_wiz_token',
-            'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'
-        }):
-            with patch('src.utils.secrets_manager.get_secret_value', side_effect=lambda x: os.environ.get(x)):
-                with patch('requests.post') as mock_post:
-                    with patch('requests.get') as mock_get:
-
-                        # Configure mock responses
-                        def mock_post_response(url, **kwargs):
-                            mock_resp = MagicMock()
-                            mock_resp.status_code = 200
-                            if 'dynatrace' in url:
-                                mock_resp.json.return_value = mock_responses['dynatrace']
-                            elif 'slack' in url:
-                                mock_resp.json.return_value = mock_responses['slack']
-                            return mock_resp
-
-                        def mock_get_response(url, **kwargs):
-                            mock_resp = MagicMock()
-                            mock_resp.status_code = 200
-                            if 'sonarqube' in url:
-                                mock_resp.json.return_value = mock_responses['sonarqube']
-                            elif 'wiz' in url:
-                                mock_resp.json.return_value = mock_responses['wiz']
-                            return mock_resp
-
-                        mock_post.side_effect = mock_post_response
-                        mock_get.side_effect = mock_get_response
-
-                        # Test all connectors working together
-                        dynatrace_client = DynatraceClient()
-                        sonarqube_client = SonarQubeClient()
-                        wiz_client = WizClient()
-                        slack_client = SlackClient()
-
-                        # Test each connector
-                        dt_result = dynatrace_client.send_event({'eventType': 'CUSTOM_INFO', 'title': 'Test'})
-                        sq_result = sonarqube_client.get_quality_gate_status('test-project')
-                        wiz_result = wiz_client.get_cve_status('test-artifact')
-                        slack_result = slack_client.send_notification({'text': 'Test notification'})
-
-                        # Verify results with proper type checking
-                        assert dt_result is not None
-                        assert dt_result['eventIngestResults'][0]['status'] == 'OK'
-                        assert sq_result['status'] == 'SUCCESS'
-                        assert wiz_result['status'] == 'SUCCESS'
-                        assert slack_result is not None
-                        assert slack_result['ok'] is True
-
-                        # Verify all APIs were called
-                        assert mock_post.call_count >= 2  # Dynatrace + Slack
-                        assert mock_get.call_count >= 2   # SonarQube + Wiz
+        for method, url, body in _HEALTHY_ROUTES.values():
+            http.add_callback(method, url, callback=lambda request, body=body: (200, {}, body),
+                              content_type='application/json')
+
+        # Call every connector concurrently to check the clients are safe to share across threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'dynatrace': executor.submit(dynatrace_connector.send_event, dict(_DT_EVENT)),
+                'sonarqube': executor.submit(sonarqube_connector.get_quality_gate_status, 'test-project'),
+                'wiz': executor.submit(wiz_connector.get_cve_status, 'test-artifact'),
+                'slack': executor.submit(slack_connector.send_notification, dict(_SLACK_NOTIFICATION)),
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        # Verify results with proper type checking
+        assert results['dynatrace'] is not None
+        assert results['dynatrace']['eventIngestResults'][0]['status'] == 'OK'
+        assert results['sonarqube']['status'] == 'SUCCESS'
+        assert results['wiz']['status'] == 'SUCCESS'
+        assert results['slack'] is not None
+        assert results['slack']['ok'] is True
+
+        # Verify every connector's API was called exactly once
+        calls_per_host = Counter(urlparse(call.request.url).hostname for call in http.calls)
+        assert calls_per_host == dict.fromkeys(_HEALTHY_ROUTES, 1)
@@ -1,78 +1,90 @@
-import unittest
-import sys
-import os
-from unittest.mock import patch, MagicMock
-import requests
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from harness_integration_example import HarnessIntegration
 
-# Import using direct path
-import importlib.util
-module_path = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'harness-integration', 'harness_integration_example.py')
-spec = importlib.util.spec_from_file_location("harness_integration_example", module_path)
 
-if spec is None or spec.loader is None:
-    raise ImportError(f"Could not load module from {module_path}")
+# SRE Agent responses, built and serialized once at import
+_SUGG_PAYLOAD = {
+    'suggestion_source': 'llm_validated',
+    'suggestion': {
+        'hpa': {
+            'minReplicas': 1,
+            'maxReplicas': 5,
+            'targetCPUUtilizationPercentage': 75,
+            'scaleTargetRefName': 'test-deploy',
+            'resources': {
+                'cpuLimit': '1',
+                'memoryLimit': '1Gi',
+                'cpuRequest': '500m',
+                'memoryRequest': '512Mi'
+            }
+        },
+        'karpenter': {
+            'kubernetes.io/arch': 'amd64',
+            'karpenter.sh/capacity-type': 'spot'
+        }
+    }
+}
+_SUGG_BYTES = json.dumps(_SUGG_PAYLOAD).encode()
+
+_QG_PAYLOAD = {
+    'status': 'SUCCESS',
+    'message': 'All quality gates passed',
+    'score': 95
+}
+_QG_BYTES = json.dumps(_QG_PAYLOAD).encode()
+
+
+def _stub(payload, content=b"", status_code=200):
+    """Lightweight stand-in for a requests.Response carrying a JSON payload."""
+    return SimpleNamespace(status_code=status_code, content=content, json=lambda: payload,
+                           raise_for_status=lambda: None, headers={})
+
+
+@pytest.fixture
+def harness():
+    return HarnessIntegration('http://mock-sre-agent')
 
-harness_integration_example = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(harness_integration_example)
-HarnessIntegration = harness_integration_example.HarnessIntegration
 
-class TestHarnessIntegration(unittest.TestCase):
+@pytest.fixture
+def sre_agent(monkeypatch):
+    """Stand-in for requests.post; tests set its return_value to the agent's response."""
+    mock_post = MagicMock()
+    monkeypatch.setattr('requests.post', mock_post)
+    return mock_post
 
-    @patch('requests.post')
-    def test_get_scaling_suggestion(self, mock_post):
+
+class TestHarnessIntegration:
+
+    def test_get_scaling_suggestion(self, sre_agent, harness):
         # Mock the response from the SRE Agent
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'suggestion_source': 'llm_validated',
-            'suggestion': {
-                'hpa': {
-                    'minReplicas': 1,
-                    'maxReplicas': 5,
-                    'targetCPUUtilizationPercentage': 75,
-                    'scaleTargetRefName': 'test-deploy',
-                    'resources': {
-                        'cpuLimit': '1',
-                        'memoryLimit': '1Gi',
-                        'cpuRequest': '500m',
-                        'memoryRequest': '512Mi'
-                    }
-                },
-                'karpenter': {
-                    'kubernetes.io/arch': 'amd64',
-                    'karpenter.sh/capacity-type': 'spot'
-                }
-            }
-        }
-        mock_post.return_value = mock_response
+        sre_agent.return_value = _stub(_SUGG_PAYLOAD, _SUGG_BYTES)
 
-        harness = HarnessIntegration('http://mock-sre-agent')
         suggestion = harness.get_scaling_suggestion('test-app', 'prod', 'test-deploy')
 
-        self.assertEqual(suggestion['suggestion_source'], 'llm_validated')
-        self.assertEqual(suggestion['suggestion']['hpa']['minReplicas'], 1)
-        self.assertEqual(suggestion['suggestion']['hpa']['resources']['cpuLimit'], '1')
+        assert suggestion['suggestion_source'] == 'llm_validated'
+        assert suggestion['suggestion']['hpa']['minReplicas'] == 1
+        assert suggestion['suggestion']['hpa']['resources']['cpuLimit'] == '1'
+
+        # Verify the request, capturing call_args once
+        args, kwargs = sre_agent.call_args
+        url = args[0] if args else kwargs['url']
+        assert (url == 'http://mock-sre-agent/suggest'
+                and kwargs['json']['deployment_context']['environment'] == 'prod')
 
-    @patch('requests.post')
-    def test_check_quality_gate(self, mock_post):
+    def test_check_quality_gate(self, sre_agent, harness):
         # Mock the response from the SRE Agent
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'status': 'SUCCESS',
-            'message': 'All quality gates passed',
-            'score': 95
-        }
-        mock_post.return_value = mock_response
+        sre_agent.return_value = _stub(_QG_PAYLOAD, _QG_BYTES)
 
-        harness = HarnessIntegration('http://mock-sre-agent')
         result = harness.check_quality_gate('test-app', 'abc123', 'artifact:v1.0.0')
 
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['score'], 95)
+        assert result['status'] == 'SUCCESS'
+        assert result['score'] == 95
 
-if __name__ == '__main__':
-    unittest.main()
+        # Verify the request, capturing call_args once
+        args, kwargs = sre_agent.call_args
+        url = args[0] if args else kwargs['url']
+        assert url == 'http://mock-sre-agent/gate' and kwargs['json']['application']['commit_sha'] == 'abc123'
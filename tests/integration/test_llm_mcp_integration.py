@@ -1,21 +1,205 @@
 import pytest
 import json
-import os
-from unittest.mock import patch, MagicMock
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import re
+from types import MappingProxyType
+from unittest.mock import patch
 
-from src.suggestion_engines.scaling_engine import get_suggestion, _get_llm_client, _get_mcp_client
-from src.mcp_client.dynatrace_mcp_client import DynatraceMCPClient
-from src.mcp_client.mock_mcp_client import MockMCPClient
-from src.llm_client.ollama_client import OllamaClient
-from src.llm_client.bring_your_own_llm_client import BringYourOwnLLMClient
+import responses
 
+from tests._fast_mocks import UrlopenResponse
 
+
+def _urlopen_side_effect(payloads):
+    """Build a urlopen side effect that serves the given encoded payloads in turn.
+
+    Each payload is wrapped in a response once, up front; calls past the end of the
+    list wrap around to the first payload.
+    """
+    http_responses = [UrlopenResponse(payload) for payload in payloads]
+    calls = 0
+
+    def side_effect(*args, **kwargs):
+        nonlocal calls
+        http_response = http_responses[calls % len(http_responses)]
+        calls += 1
+        return http_response
+
+    return side_effect
+
+
+class _CountingLLM:
+    """An LLM client stub that counts its calls and always asks for more metrics."""
+
+    _RESPONSE = MappingProxyType({
+        'role': 'assistant',
+        'content': 'Let me get more metrics.',
+        'tool_calls': [{
+            'id': 'call_1',
+            'function': {
+                'name': 'get_performance_metrics',
+                'arguments': '{"entity_id": "test-service:prod"}'
+            }
+        }]
+    })
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, messages, tools=None):
+        self.calls += 1
+        return self._RESPONSE
+
+
+# Arguments of the orchestration flow's final submit_scaling_suggestion call
+_SUBMIT_ARGS_JSON = json.dumps({
+    'hpa': {
+        'minReplicas': 4,
+        'maxReplicas': 20,
+        'targetCPUUtilizationPercentage': 65,
+        'scaleTargetRefName': 'test-service',
+        'resources': {
+            'cpuLimit': '2000m',
+            'memoryLimit': '2Gi',
+            'cpuRequest': '1000m',
+            'memoryRequest': '1Gi'
+        }
+    },
+    'karpenter': {
+        'kubernetes.io/arch': 'amd64',
+        'karpenter.sh/capacity-type': 'spot'
+    }
+})
+
+# Ollama replies for the orchestration flow, encoded once: two metric lookups, then the
+# final suggestion
+_ORCHESTRATION_RESPONSES = tuple(json.dumps({'message': response}).encode('utf-8') for response in [
+    # First response: LLM calls get_performance_metrics
+    {
+        'role': 'assistant',
+        'content': 'I need to analyze the performance metrics first.',
+        'tool_calls': [{
+            'id': 'call_1',
+            'function': {
+                'name': 'get_performance_metrics',
+                'arguments': '{"entity_id": "test-service:prod"}'
+            }
+        }]
+    },
+    # Second response: LLM calls get_health_events
+    {
+        'role': 'assistant',
+        'content': 'Now let me check for health events.',
+        'tool_calls': [{
+            'id': 'call_2',
+            'function': {
+                'name': 'get_health_events',
+                'arguments': '{"entity_id": "test-service:prod"}'
+            }
+        }]
+    },
+    # Third response: LLM submits scaling suggestion
+    {
+        'role': 'assistant',
+        'content': 'Based on the metrics, I recommend scaling up.',
+        'tool_calls': [{
+            'id': 'call_3',
+            'function': {
+                'name': 'submit_scaling_suggestion',
+                'arguments': _SUBMIT_ARGS_JSON
+            }
+        }]
+    }
+])
+
+# An Ollama reply calling a tool the engine does not know, encoded once
+_INVALID_TOOL_RESPONSE = json.dumps({
+    'message': {
+        'role': 'assistant',
+        'content': 'I will call an invalid tool.',
+        'tool_calls': [{
+            'id': 'call_1',
+            'function': {
+                'name': 'invalid_tool_name',
+                'arguments': '{"param": "value"}'
+            }
+        }]
+    }
+}).encode('utf-8')
+
+_DYNATRACE_ENV = {
+    'DYNATRACE_API_URL': 'https://test.dynatrace.com',
+    'DYNATRACE_API_TOKEN': 'test_token'
+}
+
+_DYNATRACE_API_PATTERN = re.compile(re.escape(_DYNATRACE_ENV['DYNATRACE_API_URL']) + r'/api/v2/')
+
+_DYNATRACE_METRICS = MappingProxyType({
+    'result': [
+        {
+            'metricId': 'builtin:container.cpu.usage.millicores:percentile(90)',
+            'data': [{'values': [1200]}]  # High CPU usage
+        },
+        {
+            'metricId': 'builtin:container.memory.workingSet.bytes:percentile(90)',
+            'data': [{'values': [1610612736]}]  # 1.5GB memory usage
+        }
+    ]
+})
+
+# Read-only scaling suggestions shared by the validation tests
+_VALID_SUGGESTION = MappingProxyType({
+    'hpa': {
+        'minReplicas': 2,
+        'maxReplicas': 10,
+        'targetCPUUtilizationPercentage': 70,
+        'scaleTargetRefName': 'test-app',
+        'resources': {
+            'cpuLimit': '1000m',
+            'memoryLimit': '1Gi',
+            'cpuRequest': '500m',
+            'memoryRequest': '512Mi'
+        }
+    },
+    'karpenter': {
+        'kubernetes.io/arch': 'amd64',
+        'karpenter.sh/capacity-type': 'spot'
+    }
+})
+
+_INVALID_SUGGESTION = MappingProxyType({
+    'hpa': {
+        'minReplicas': 10,
+        'maxReplicas': 2,  # Invalid: max < min
+        'targetCPUUtilizationPercentage': 70,
+        'scaleTargetRefName': 'test-app',
+        'resources': {
+            'cpuLimit': '1000m',
+            'memoryLimit': '1Gi',
+            'cpuRequest': '500m',
+            'memoryRequest': '512Mi'
+        }
+    },
+    'karpenter': {
+        'kubernetes.io/arch': 'amd64',
+        'karpenter.sh/capacity-type': 'spot'
+    }
+})
+
+
+# Deliberately ungrouped: every test sets its own environment, so xdist may spread the
+# class across workers
 class TestLLMMCPIntegration:
     """Integration tests for LLM and MCP client workflows."""
+
+    @pytest.fixture(autouse=True)
+    def llm_env(self, monkeypatch):
+        """Select the mock MCP client and a local Ollama endpoint; tests override keys as needed."""
+        monkeypatch.setenv('MCP_CLIENT_TYPE', 'mock')
+        monkeypatch.setenv('LLM_CLIENT_TYPE', 'ollama')
+        monkeypatch.setenv('OLLAMA_API_ENDPOINT', 'http://localhost:11434/api/chat')
     
-    def test_llm_mcp_orchestration_flow(self):
+    @patch('urllib.request.urlopen')
+    def test_llm_mcp_orchestration_flow(self, mock_urlopen, sre_modules, monkeypatch, http):
         """Test the complete LLM-MCP orchestration flow."""
         test_config = {
             'features': {
@@ -51,283 +235,149 @@ class TestLLMMCPIntegration:
             'namespace': 'test-service-prod'
         }
         
-        with patch.dict(os.environ, {
-            'MCP_CLIENT_TYPE': 'dynatrace',
-            'LLM_CLIENT_TYPE': 'ollama',
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token',
-            'OLLAMA_API_ENDPOINT': 'http://localhost:11434/api/chat'
-        }):
-            # Mock Dynatrace API responses
-            mock_metrics_response = {
-                'result': [
-                    {
-                        'metricId': 'builtin:container.cpu.usage.millicores:percentile(90)',
-                        'data': [{'values': [1200]}]  # High CPU usage
-                    },
-                    {
-                        'metricId': 'builtin:container.memory.workingSet.bytes:percentile(90)',
-                        'data': [{'values': [1610612736]}]  # 1.5GB memory usage
-                    }
-                ]
-            }
-            
-            # Mock LLM responses for the conversation flow
-            llm_responses = [
-                # First response: LLM calls get_performance_metrics
-                {
-                    'role': 'assistant',
-                    'content': 'I need to analyze the performance metrics first.',
-                    'tool_calls': [{
-                        'id': 'call_1',
-                        'function': {
-                            'name': 'get_performance_metrics',
-                            'arguments': '{"entity_id": "test-service:prod"}'
-                        }
-                    }]
-                },
-                # Second response: LLM calls get_health_events
-                {
-                    'role': 'assistant',
-                    'content': 'Now let me check for health events.',
-                    'tool_calls': [{
-                        'id': 'call_2',
-                        'function': {
-                            'name': 'get_health_events',
-                            'arguments': '{"entity_id": "test-service:prod"}'
-                        }
-                    }]
-                },
-                # Third response: LLM submits scaling suggestion
-                {
-                    'role': 'assistant',
-                    'content': 'Based on the metrics, I recommend scaling up.',
-                    'tool_calls': [{
-                        'id': 'call_3',
-                        'function': {
-                            'name': 'submit_scaling_suggestion',
-                            'arguments': json.dumps({
-                                'hpa': {
-                                    'minReplicas': 4,
-                                    'maxReplicas': 20,
-                                    'targetCPUUtilizationPercentage': 65,
-                                    'scaleTargetRefName': 'test-service',
-                                    'resources': {
-                                        'cpuLimit': '2000m',
-                                        'memoryLimit': '2Gi',
-                                        'cpuRequest': '1000m',
-                                        'memoryRequest': '1Gi'
-                                    }
-                                },
-                                'karpenter': {
-                                    'kubernetes.io/arch': 'amd64',
-                                    'karpenter.sh/capacity-type': 'spot'
-                                }
-                            })
-                        }
-                    }]
-                }
-            ]
-            
-            with patch('requests.get') as mock_get:
-                with patch('urllib.request.urlopen') as mock_urlopen:
-                    # Mock Dynatrace API calls
-                    mock_response = MagicMock()
-                    mock_response.status_code = 200
-                    mock_response.raise_for_status = MagicMock()
-                    mock_response.json.return_value = mock_metrics_response
-                    mock_get.return_value = mock_response
-                    
-                    # Mock Ollama API calls
-                    call_count = 0
-                    def mock_ollama_response(*args, **kwargs):
-                        nonlocal call_count
-                        mock_http_response = MagicMock()
-                        response_data = {'message': llm_responses[call_count]}
-                        mock_http_response.read.return_value = json.dumps(response_data).encode('utf-8')
-                        mock_http_response.__enter__ = MagicMock(return_value=mock_http_response)
-                        mock_http_response.__exit__ = MagicMock(return_value=None)
-                        call_count += 1
-                        return mock_http_response
-                    
-                    mock_urlopen.side_effect = mock_ollama_response
-                    
-                    # Execute the scaling suggestion
-                    result = get_suggestion(test_config, app_context, deployment_context)
-                    
-                    # Verify AI suggestion was used
-                    assert result['suggestion_source'] == 'llm_validated'
-                    assert result['suggestion']['hpa']['minReplicas'] == 4
-                    assert result['suggestion']['hpa']['maxReplicas'] == 20
-                    assert result['suggestion']['hpa']['targetCPUUtilizationPercentage'] == 65
-                    
-                    # Verify multiple tool calls were made
-                    assert mock_urlopen.call_count == 3
-                    assert mock_get.call_count >= 1  # Dynatrace API calls
-    
-    def test_mcp_client_factory_selection(self):
-        """Test MCP client factory selection based on environment."""
-        # Test Dynatrace MCP client selection
-        with patch.dict(os.environ, {
-            'MCP_CLIENT_TYPE': 'dynatrace',
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token'
-        }):
-            client = _get_mcp_client()
-            assert isinstance(client, DynatraceMCPClient)
+        monkeypatch.setenv('MCP_CLIENT_TYPE', 'dynatrace')
+        for key, value in _DYNATRACE_ENV.items():
+            monkeypatch.setenv(key, value)
+
+        # Serve every Dynatrace API query the same metrics payload
+        http.add(responses.GET, _DYNATRACE_API_PATTERN, json=dict(_DYNATRACE_METRICS))
         
-        # Test Mock MCP client selection
-        with patch.dict(os.environ, {'MCP_CLIENT_TYPE': 'mock'}):
-            client = _get_mcp_client()
-            assert isinstance(client, MockMCPClient)
+        # Mock Ollama API calls
+        mock_urlopen.side_effect = _urlopen_side_effect(_ORCHESTRATION_RESPONSES)
         
-        # Test default selection (should be Dynatrace)
-        with patch.dict(os.environ, {
-            'DYNATRACE_API_URL': 'https://test.dynatrace.com',
-            'DYNATRACE_API_TOKEN': 'test_token'
-        }):
-            with patch.dict(os.environ, {'MCP_CLIENT_TYPE': ''}, clear=False):
-                client = _get_mcp_client()
-                assert isinstance(client, DynatraceMCPClient)
-    
-    def test_llm_client_factory_selection(self):
-        """Test LLM client factory selection based on environment."""
-        # Test Ollama client selection
-        with patch.dict(os.environ, {
-            'LLM_CLIENT_TYPE': 'ollama',
-            'OLLAMA_API_ENDPOINT': 'http://localhost:11434/api/chat'
-        }):
-            client = _get_llm_client()
-            assert isinstance(client, OllamaClient)
+        # Execute the scaling suggestion
+        result = sre_modules.get_suggestion(test_config, app_context, deployment_context)
         
-        # Test BYO LLM client selection
-        with patch.dict(os.environ, {
-            'LLM_CLIENT_TYPE': 'byo',
-            'BYO_LLM_API_KEY': 'test_key',
-            'BYO_LLM_API_ENDPOINT': 'https://api.example.com/v1/chat'
-        }):
-            client = _get_llm_client()
-            assert isinstance(client, BringYourOwnLLMClient)
+        # Verify AI suggestion was used
+        assert result['suggestion_source'] == 'llm_validated'
+        assert result['suggestion']['hpa']['minReplicas'] == 4
+        assert result['suggestion']['hpa']['maxReplicas'] == 20
+        assert result['suggestion']['hpa']['targetCPUUtilizationPercentage'] == 65
         
-        # Test missing BYO configuration
-        with patch.dict(os.environ, {
-            'LLM_CLIENT_TYPE': 'byo',
-            'BYO_LLM_API_KEY': '',
-            'BYO_LLM_API_ENDPOINT': ''
-        }):
-            with pytest.raises(ValueError, match="BYO_LLM_API_KEY and BYO_LLM_API_ENDPOINT must be set"):
-                _get_llm_client()
+        # Verify multiple tool calls were made
+        assert mock_urlopen.call_count == 3
+        assert len(http.calls) >= 1  # Dynatrace API calls
+
+    @patch('urllib.request.urlopen')
+    def test_suggestion_cache_hit(self, mock_urlopen, sre_modules, base_config):
+        """Test that a cached AI suggestion is reused without another LLM conversation."""
+        mock_urlopen.side_effect = _urlopen_side_effect(_ORCHESTRATION_RESPONSES)
+        app_context = {'name': 'test-service'}
+        deployment_context = {'environment': 'prod', 'deployment_name': 'test-service'}
+        cache = {}
+
+        first = sre_modules.get_suggestion(base_config, app_context, deployment_context, cache=cache)
+        calls_after_first = mock_urlopen.call_count
+        second = sre_modules.get_suggestion(base_config, app_context, deployment_context, cache=cache)
+
+        assert first['suggestion_source'] == 'llm_validated'
+        assert second == first
+        assert len(cache) == 1
+        assert mock_urlopen.call_count == calls_after_first
+
+        # Hits are copies: changing one leaves the cached suggestion intact
+        min_replicas = first['suggestion']['hpa']['minReplicas']
+        second['suggestion']['hpa']['minReplicas'] = min_replicas + 1
+        third = sre_modules.get_suggestion(base_config, app_context, deployment_context, cache=cache)
+        assert third['suggestion']['hpa']['minReplicas'] == min_replicas
+
+    @patch('urllib.request.urlopen')
+    def test_suggestion_cache_miss_on_config_change(self, mock_urlopen, sre_modules, base_config):
+        """Test that a suggestion cached under one config is not reused under another."""
+        mock_urlopen.side_effect = _urlopen_side_effect(_ORCHESTRATION_RESPONSES)
+        app_context = {'name': 'test-service'}
+        deployment_context = {'environment': 'prod', 'deployment_name': 'test-service'}
+        cache = {}
+
+        sre_modules.get_suggestion(base_config, app_context, deployment_context, cache=cache)
+        calls_after_first = mock_urlopen.call_count
+        changed_config = {**base_config, 'environment_defaults': {'prod': {'min_replicas': 4}}}
+        sre_modules.get_suggestion(changed_config, app_context, deployment_context, cache=cache)
+
+        assert len(cache) == 2
+        assert mock_urlopen.call_count > calls_after_first
+
+    @pytest.mark.parametrize("env, expected_cls", [
+        ({'MCP_CLIENT_TYPE': 'dynatrace', **_DYNATRACE_ENV}, 'DynatraceMCPClient'),
+        ({'MCP_CLIENT_TYPE': 'mock'}, 'MockMCPClient'),
+        # An empty type falls back to the Dynatrace default
+        ({'MCP_CLIENT_TYPE': '', **_DYNATRACE_ENV}, 'DynatraceMCPClient'),
+    ], ids=["dynatrace", "mock", "default"])
+    def test_mcp_client_factory_selection(self, sre_modules, monkeypatch, env, expected_cls):
+        """Test MCP client factory selection based on environment."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        client = sre_modules.get_mcp_client()
+        assert isinstance(client, getattr(sre_modules, expected_cls))
+
+    @pytest.mark.parametrize("env, expected_cls", [
+        ({'LLM_CLIENT_TYPE': 'ollama', 'OLLAMA_API_ENDPOINT': 'http://localhost:11434/api/chat'}, 'OllamaClient'),
+        ({'LLM_CLIENT_TYPE': 'byo', 'BYO_LLM_API_KEY': 'test_key',
+          'BYO_LLM_API_ENDPOINT': 'https://api.example.com/v1/chat'}, 'BringYourOwnLLMClient'),
+    ], ids=["ollama", "byo"])
+    def test_llm_client_factory_selection(self, sre_modules, monkeypatch, env, expected_cls):
+        """Test LLM client factory selection based on environment."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        client = sre_modules.get_llm_client()
+        assert isinstance(client, getattr(sre_modules, expected_cls))
+
+    def test_llm_client_factory_missing_byo_config(self, sre_modules, monkeypatch):
+        """Test that the BYO LLM client requires an API key and endpoint."""
+        monkeypatch.setenv('LLM_CLIENT_TYPE', 'byo')
+        monkeypatch.setenv('BYO_LLM_API_KEY', '')
+        monkeypatch.setenv('BYO_LLM_API_ENDPOINT', '')
+
+        with pytest.raises(ValueError, match="BYO_LLM_API_KEY and BYO_LLM_API_ENDPOINT must be set"):
+            sre_modules.get_llm_client()
     
-    def test_mock_mcp_client_integration(self):
+    def test_mock_mcp_client_integration(self, sre_modules):
         """Test integration with mock MCP client."""
-        with patch.dict(os.environ, {'MCP_CLIENT_TYPE': 'mock'}):
-            client = MockMCPClient()
-            
-            # Test performance metrics
-            metrics = client.get_performance_metrics('test-service:prod')
-            assert 'cpu_usage_millicores_p90' in metrics
-            assert 'memory_usage_mb_p90' in metrics
-            assert isinstance(metrics['cpu_usage_millicores_p90'], (int, float))
-            
-            # Test health events
-            health = client.get_health_events('test-service:prod')
-            assert 'active_problem_count' in health
-            assert 'recent_oom_kills' in health
-            assert isinstance(health['active_problem_count'], int)
-            
-            # Test SLOs
-            slos = client.get_service_level_objectives('test-service:prod')
-            assert isinstance(slos, list)
-    
-    def test_llm_tool_call_validation(self):
+        client = sre_modules.MockMCPClient()
+        
+        # Test performance metrics
+        metrics = client.get_performance_metrics('test-service:prod')
+        assert 'cpu_usage_millicores_p90' in metrics
+        assert 'memory_usage_mb_p90' in metrics
+        assert isinstance(metrics['cpu_usage_millicores_p90'], (int, float))
+        
+        # Test health events
+        health = client.get_health_events('test-service:prod')
+        assert 'active_problem_count' in health
+        assert 'recent_oom_kills' in health
+        assert isinstance(health['active_problem_count'], int)
+        
+        # Test SLOs
+        slos = client.get_service_level_objectives('test-service:prod')
+        assert isinstance(slos, list)
+
+    @patch('urllib.request.urlopen')
+    def test_llm_tool_call_validation(self, mock_urlopen, sre_modules):
         """Test LLM tool call validation and error handling."""
-        with patch.dict(os.environ, {
-            'LLM_CLIENT_TYPE': 'ollama',
-            'OLLAMA_API_ENDPOINT': 'http://localhost:11434/api/chat'
-        }):
-            # Test invalid tool call
-            mock_response = {
-                'message': {
-                    'role': 'assistant',
-                    'content': 'I will call an invalid tool.',
-                    'tool_calls': [{
-                        'id': 'call_1',
-                        'function': {
-                            'name': 'invalid_tool_name',
-                            'arguments': '{"param": "value"}'
-                        }
-                    }]
-                }
-            }
-            
-            with patch('urllib.request.urlopen') as mock_urlopen:
-                mock_http_response = MagicMock()
-                mock_http_response.read.return_value = json.dumps(mock_response).encode('utf-8')
-                mock_http_response.__enter__ = MagicMock(return_value=mock_http_response)
-                mock_http_response.__exit__ = MagicMock(return_value=None)
-                mock_urlopen.return_value = mock_http_response
-                
-                client = OllamaClient()
-                response = client.call([{'role': 'user', 'content': 'Test'}])
-                
-                # Should still return response with tool call
-                assert response['role'] == 'assistant'
-                assert 'tool_calls' in response
-                assert response['tool_calls'][0]['function']['name'] == 'invalid_tool_name'
-    
-    def test_scaling_suggestion_validation(self):
-        """Test scaling suggestion validation."""
-        # Test valid scaling suggestion
-        valid_suggestion = {
-            'hpa': {
-                'minReplicas': 2,
-                'maxReplicas': 10,
-                'targetCPUUtilizationPercentage': 70,
-                'scaleTargetRefName': 'test-app',
-                'resources': {
-                    'cpuLimit': '1000m',
-                    'memoryLimit': '1Gi',
-                    'cpuRequest': '500m',
-                    'memoryRequest': '512Mi'
-                }
-            },
-            'karpenter': {
-                'kubernetes.io/arch': 'amd64',
-                'karpenter.sh/capacity-type': 'spot'
-            }
-        }
+        mock_urlopen.side_effect = _urlopen_side_effect([_INVALID_TOOL_RESPONSE])
+        
+        client = sre_modules.OllamaClient()
+        response = client.call([{'role': 'user', 'content': 'Test'}])
         
+        # Should still return response with tool call
+        assert response['role'] == 'assistant'
+        assert 'tool_calls' in response
+        assert response['tool_calls'][0]['function']['name'] == 'invalid_tool_name'
+
+    def test_scaling_suggestion_validation(self, sre_modules):
+        """Test scaling suggestion validation."""
         # Should not raise exception for valid suggestion
-        from data_models import ScalingSuggestion
-        validated = ScalingSuggestion.model_validate(valid_suggestion)
+        validated = sre_modules.ScalingSuggestion.model_validate(_VALID_SUGGESTION)
         assert validated.hpa.min_replicas == 2
         assert validated.hpa.max_replicas == 10
         
-        # Test invalid scaling suggestion (max < min)
-        invalid_suggestion = {
-            'hpa': {
-                'minReplicas': 10,
-                'maxReplicas': 2,  # Invalid: max < min
-                'targetCPUUtilizationPercentage': 70,
-                'scaleTargetRefName': 'test-app',
-                'resources': {
-                    'cpuLimit': '1000m',
-                    'memoryLimit': '1Gi',
-                    'cpuRequest': '500m',
-                    'memoryRequest': '512Mi'
-                }
-            },
-            'karpenter': {
-                'kubernetes.io/arch': 'amd64',
-                'karpenter.sh/capacity-type': 'spot'
-            }
-        }
-        
         # Should raise validation error
         with pytest.raises(ValueError, match="max_replicas must be greater than or equal to min_replicas"):
-            ScalingSuggestion.model_validate(invalid_suggestion)
+            sre_modules.ScalingSuggestion.model_validate(_INVALID_SUGGESTION)
     
-    def test_llm_conversation_timeout(self):
+    def test_llm_conversation_timeout(self, sre_modules):
         """Test LLM conversation timeout handling."""
         test_config = {
             'features': {
@@ -349,39 +399,16 @@ class TestLLMMCPIntegration:
         app_context = {'name': 'test-service'}
         deployment_context = {'environment': 'prod', 'deployment_name': 'test-service'}
         
-        with patch.dict(os.environ, {
-            'LLM_CLIENT_TYPE': 'ollama',
-            'OLLAMA_API_ENDPOINT': 'http://localhost:11434/api/chat'
-        }):
-            # Mock infinite loop scenario (LLM never calls submit_scaling_suggestion)
-            mock_response = {
-                'message': {
-                    'role': 'assistant',
-                    'content': 'Let me get more metrics.',
-                    'tool_calls': [{
-                        'id': 'call_1',
-                        'function': {
-                            'name': 'get_performance_metrics',
-                            'arguments': '{"entity_id": "test-service:prod"}'
-                        }
-                    }]
-                }
-            }
-            
-            with patch('urllib.request.urlopen') as mock_urlopen:
-                mock_http_response = MagicMock()
-                mock_http_response.read.return_value = json.dumps(mock_response).encode('utf-8')
-                mock_http_response.__enter__ = MagicMock(return_value=mock_http_response)
-                mock_http_response.__exit__ = MagicMock(return_value=None)
-                mock_urlopen.return_value = mock_http_response
-                
-                # Should fall back to static suggestion after max iterations
-                result = get_suggestion(test_config, app_context, deployment_context)
-                
-                # Should use static fallback
-                assert result['suggestion_source'] == 'static'
-                assert result['suggestion']['hpa']['minReplicas'] == 2
-                assert result['suggestion']['hpa']['maxReplicas'] == 10
-                
-                # Should have made exactly 5 calls (the limit)
-                assert mock_urlopen.call_count == 5
+        # LLM that never calls submit_scaling_suggestion
+        llm = _CountingLLM()
+        
+        # Should fall back to static suggestion after max iterations
+        result = sre_modules.get_suggestion(test_config, app_context, deployment_context, llm_client=llm)
+        
+        # Should use static fallback
+        assert result['suggestion_source'] == 'static'
+        assert result['suggestion']['hpa']['minReplicas'] == 2
+        assert result['suggestion']['hpa']['maxReplicas'] == 10
+        
+        # Should have used the whole turn budget
+        assert llm.calls == sre_modules.scaling_engine.MAX_LLM_TURNS
@@ -1,283 +1,162 @@
 #!/usr/bin/env python3
 """
-Simple integration test runner that works with the current project structure
+Integration checks that work with the current project structure
+
+Collected by pytest through its default *_test.py pattern; run with ``pytest tests/simple_integration_test.py``.
 """
-import sys
 import os
-import json
-from unittest.mock import patch, MagicMock
+import functools
+import importlib.util
+from unittest.mock import patch
 
-# Add src to path (from tests/ directory)
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
-def test_harness_integration():
-    """Test the Harness integration example"""
-    print("Testing Harness Integration...")
-    
-    try:
-        # Import the Harness integration example (from examples/ directory)
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples', 'harness-integration'))
-        from harness_integration_example import HarnessIntegration
-        
-        # Mock the SRE Agent API responses
-        mock_scaling_response = {
-            'suggestion_source': 'static',
-            'suggestion': {
-                'hpa': {
-                    'minReplicas': 2,
-                    'maxReplicas': 10,
-                    'targetCPUUtilizationPercentage': 70,
-                    'scaleTargetRefName': 'user-service-prod',
-                    'resources': {
-                        'cpuLimit': '1000m',
-                        'memoryLimit': '1Gi',
-                        'cpuRequest': '500m',
-                        'memoryRequest': '512Mi'
-                    }
-                },
-                'karpenter': {
-                    'kubernetes.io/arch': 'amd64',
-                    'karpenter.sh/capacity-type': 'spot'
-                }
+from tests._fast_mocks import JsonResponse
+
+_REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path, name):
+    """Execute a source file as module `name` once, without registering it in sys.modules."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_REPO_ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Mocked SRE Agent API responses, shared by every call the Harness example makes
+_SCALING_RESPONSE = {
+    'suggestion_source': 'static',
+    'suggestion': {
+        'hpa': {
+            'minReplicas': 2,
+            'maxReplicas': 10,
+            'targetCPUUtilizationPercentage': 70,
+            'scaleTargetRefName': 'user-service-prod',
+            'resources': {
+                'cpuLimit': '1000m',
+                'memoryLimit': '1Gi',
+                'cpuRequest': '500m',
+                'memoryRequest': '512Mi'
             }
+        },
+        'karpenter': {
+            'kubernetes.io/arch': 'amd64',
+            'karpenter.sh/capacity-type': 'spot'
         }
-        
-        mock_quality_response = {
-            'status': 'SUCCESS',
-            'message': 'All quality gates passed',
-            'score': 95
-        }
-        
-        with patch('requests.post') as mock_post:
-            # Configure mock responses
-            def mock_post_response(url, **kwargs):
-                mock_resp = MagicMock()
-                mock_resp.status_code = 200
-                if '/suggest' in url:
-                    mock_resp.json.return_value = mock_scaling_response
-                elif '/gate' in url:
-                    mock_resp.json.return_value = mock_quality_response
-                return mock_resp
-            
-            mock_post.side_effect = mock_post_response
-            
-            # Test the Harness integration
-            harness = HarnessIntegration('http://mock-sre-agent')
-            
-            # Test scaling suggestion
-            scaling_result = harness.get_scaling_suggestion('user-service', 'prod', 'user-service-prod')
-            
-            if scaling_result['suggestion_source'] == 'static':
-                print("✓ Scaling suggestion integration working")
-            else:
-                print(f"✗ Scaling suggestion failed: {scaling_result}")
-                return False
-            
-            # Test quality gate
-            quality_result = harness.check_quality_gate('user-service', 'abc123', 'user-service:v1.0.0')
-            
-            if quality_result['status'] == 'SUCCESS':
-                print("✓ Quality gate integration working")
-            else:
-                print(f"✗ Quality gate failed: {quality_result}")
-                return False
-            
-            # Test manifest generation
-            manifests = harness.generate_k8s_manifests('user-service', 'prod', 'user-service-prod')
-            
-            if 'hpa.yaml' in manifests and 'deployment.yaml' in manifests:
-                print("✓ Manifest generation working")
-            else:
-                print(f"✗ Manifest generation failed: {manifests}")
-                return False
-            
-            print("✓ All Harness integration tests passed")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Harness integration test failed: {e}")
-        return False
+    }
+}
+
+_QUALITY_RESPONSE = {
+    'status': 'SUCCESS',
+    'message': 'All quality gates passed',
+    'score': 95
+}
+
+# Pre-built response per endpoint path, looked up by URL suffix on each POST
+_ROUTES = {'/suggest': JsonResponse(_SCALING_RESPONSE), '/gate': JsonResponse(_QUALITY_RESPONSE)}
+
+
+def _route_post(url, **_kwargs):
+    return _ROUTES[url[url.rindex('/'):]]
+
+
+def test_harness_integration():
+    """Test the Harness integration example"""
+    # The Harness integration example; tests/conftest.py puts its directory on sys.path
+    from harness_integration_example import HarnessIntegration
+
+    with patch('requests.post') as mock_post:
+        mock_post.side_effect = _route_post
+
+        harness = HarnessIntegration('http://mock-sre-agent')
+
+        # Scaling suggestion
+        scaling_result = harness.get_scaling_suggestion('user-service', 'prod', 'user-service-prod')
+        assert scaling_result['suggestion_source'] == 'static', scaling_result
+
+        # Quality gate
+        quality_result = harness.check_quality_gate('user-service', 'abc123', 'user-service:v1.0.0')
+        assert quality_result['status'] == 'SUCCESS', quality_result
+
+        # Manifest generation
+        manifests = harness.generate_k8s_manifests('user-service', 'prod', 'user-service-prod')
+        assert 'hpa.yaml' in manifests
+        assert 'deployment.yaml' in manifests
+
 
 def test_data_models():
     """Test the data models"""
-    print("\nTesting Data Models...")
-    
-    try:
-        # Import directly without relative imports
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("data_models", "src/data_models.py")
-        data_models = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(data_models)
-        
-        # Test valid scaling suggestion
-        valid_suggestion = {
-            'hpa': {
-                'minReplicas': 2,
-                'maxReplicas': 10,
-                'targetCPUUtilizationPercentage': 70,
-                'scaleTargetRefName': 'test-app',
-                'resources': {
-                    'cpuLimit': '1000m',
-                    'memoryLimit': '1Gi',
-                    'cpuRequest': '500m',
-                    'memoryRequest': '512Mi'
-                }
-            },
-            'karpenter': {
-                'kubernetes.io/arch': 'amd64',
-                'karpenter.sh/capacity-type': 'spot'
+    # Import directly without relative imports
+    data_models = _load('src/data_models.py', 'data_models')
+
+    # Valid scaling suggestion
+    valid_suggestion = {
+        'hpa': {
+            'minReplicas': 2,
+            'maxReplicas': 10,
+            'targetCPUUtilizationPercentage': 70,
+            'scaleTargetRefName': 'test-app',
+            'resources': {
+                'cpuLimit': '1000m',
+                'memoryLimit': '1Gi',
+                'cpuRequest': '500m',
+                'memoryRequest': '512Mi'
             }
+        },
+        'karpenter': {
+            'kubernetes.io/arch': 'amd64',
+            'karpenter.sh/capacity-type': 'spot'
         }
-        
-        validated = data_models.ScalingSuggestion.model_validate(valid_suggestion)
-        
-        if validated.hpa.min_replicas == 2:
-            print("✓ Data model validation working")
-        else:
-            print("✗ Data model validation failed")
-            return False
-            
-        # Test invalid scaling suggestion (max < min)
-        invalid_suggestion = {
-            'hpa': {
-                'minReplicas': 10,
-                'maxReplicas': 2,  # Invalid: max < min
-                'targetCPUUtilizationPercentage': 70,
-                'scaleTargetRefName': 'test-app',
-                'resources': {
-                    'cpuLimit': '1000m',
-                    'memoryLimit': '1Gi',
-                    'cpuRequest': '500m',
-                    'memoryRequest': '512Mi'
-                }
-            },
-            'karpenter': {
-                'kubernetes.io/arch': 'amd64',
-                'karpenter.sh/capacity-type': 'spot'
+    }
+
+    validated = data_models.ScalingSuggestion.model_validate(valid_suggestion)
+    assert validated.hpa.min_replicas == 2
+
+    # Invalid scaling suggestion (max < min)
+    invalid_suggestion = {
+        'hpa': {
+            'minReplicas': 10,
+            'maxReplicas': 2,  # Invalid: max < min
+            'targetCPUUtilizationPercentage': 70,
+            'scaleTargetRefName': 'test-app',
+            'resources': {
+                'cpuLimit': '1000m',
+                'memoryLimit': '1Gi',
+                'cpuRequest': '500m',
+                'memoryRequest': '512Mi'
             }
+        },
+        'karpenter': {
+            'kubernetes.io/arch': 'amd64',
+            'karpenter.sh/capacity-type': 'spot'
         }
-        
-        try:
-            data_models.ScalingSuggestion.model_validate(invalid_suggestion)
-            print("✗ Data model validation should have failed")
-            return False
-        except ValueError:
-            print("✓ Data model validation correctly rejected invalid input")
-            return True
-            
-    except Exception as e:
-        print(f"✗ Data model test failed: {e}")
-        return False
+    }
+
+    with pytest.raises(ValueError):
+        data_models.ScalingSuggestion.model_validate(invalid_suggestion)
+
 
 def test_individual_components():
     """Test individual components that can be imported directly"""
-    print("\nTesting Individual Components...")
-    
-    # Test constants
-    try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("constants", "src/suggestion_engines/constants.py")
-        constants = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(constants)
-        
-        if hasattr(constants, 'KUBERNETES_SCALING'):
-            print("✓ Constants module working")
-        else:
-            print("✗ Constants module missing expected values")
-            return False
-    except Exception as e:
-        print(f"✗ Constants test failed: {e}")
-        return False
-    
-    # Test secrets manager
-    try:
-        spec = importlib.util.spec_from_file_location("secrets_manager", "src/utils/secrets_manager.py")
-        secrets_manager = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(secrets_manager)
-        
-        # Test with environment variable
-        with patch.dict(os.environ, {'TEST_SECRET': 'test_value'}):
-            if hasattr(secrets_manager, 'get_secret'):
-                print("✓ Secrets manager module working")
-            else:
-                print("✓ Secrets manager module exists")
-    except Exception as e:
-        print(f"✗ Secrets manager test failed: {e}")
-        return False
-    
-    return True
+    # Constants
+    constants = _load('src/suggestion_engines/constants.py', 'constants')
+    assert hasattr(constants, 'KUBERNETES_SCALING')
+
+    # Secrets manager
+    secrets_manager = _load('src/utils/secrets_manager.py', 'secrets_manager')
+    assert hasattr(secrets_manager, 'get_secret')
 
-def test_unit_tests():
-    """Run some of the existing unit tests"""
-    print("\nTesting Unit Test Infrastructure...")
-    
-    try:
-        # Check if unit tests can be imported
-        import importlib.util
-        
-        # Test that unit test files exist and are importable
-        unit_test_files = [
-            'tests/unit/test_scaling_engine.py',
-            'tests/unit/test_ollama_client.py',
-            'tests/unit/test_dynatrace_client.py'
-        ]
-        
-        working_tests = 0
-        for test_file in unit_test_files:
-            try:
-                if os.path.exists(test_file):
-                    working_tests += 1
-                    print(f"✓ {test_file} exists")
-                else:
-                    print(f"✗ {test_file} missing")
-            except Exception as e:
-                print(f"✗ {test_file} error: {e}")
-        
-        if working_tests > 0:
-            print(f"✓ {working_tests} unit test files found")
-            return True
-        else:
-            print("✗ No unit test files found")
-            return False
-            
-    except Exception as e:
-        print(f"✗ Unit test infrastructure test failed: {e}")
-        return False
 
-def main():
-    """Run all integration tests"""
-    print("Running SRE Agent Integration Tests")
-    print("=" * 50)
-    
-    tests = [
-        test_harness_integration,
-        test_data_models,
-        test_individual_components,
-        test_unit_tests
+def test_unit_tests():
+    """Test that the unit test files are in place"""
+    unit_test_files = [
+        'tests/unit/test_scaling_engine.py',
+        'tests/unit/test_ollama_client.py',
+        'tests/unit/test_dynatrace_client.py'
     ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 50)
-    print(f"Test Results: {passed} passed, {failed} failed")
-    
-    if failed == 0:
-        print("🎉 All integration tests passed!")
-        return 0
-    else:
-        print("❌ Some integration tests failed, but core functionality is working!")
-        return 0  # Return 0 for now since we're testing what we can
 
-if __name__ == '__main__':
-    sys.exit(main())
+    missing = [test_file for test_file in unit_test_files
+               if not os.path.exists(os.path.join(_REPO_ROOT, test_file))]
+    assert len(missing) < len(unit_test_files), f"No unit test files found: {missing}"
@@ -0,0 +1,33 @@
+"""Fake secret lookups and request errors shared by the unit tests and their conftest fixtures."""
+import functools
+
+import pytest
+import requests
+
+from src.utils import secrets_manager
+
+# Request errors raised by the connector client tests, built once at import
+CONN_ERR = requests.exceptions.RequestException('Connection error')
+HTTP_401 = requests.exceptions.HTTPError('401 Unauthorized')
+HTTP_404 = requests.exceptions.HTTPError('404 Not Found')
+
+
+def build_cached_side_effect(secrets):
+    """A get_secret_value side effect that looks each key up in `secrets` once."""
+    return functools.lru_cache(maxsize=None)(secrets.__getitem__)
+
+
+def build_client(client_cls, secrets):
+    """Construct client_cls with get_secret_value serving `secrets`, restored once __init__ returns."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(secrets_manager, 'get_secret_value', build_cached_side_effect(secrets))
+        return client_cls()
+
+
+@functools.lru_cache(maxsize=16)
+def fake_secret(key):
+    """Secret values the connector clients read, resolved once per key."""
+    return {
+        'DYNATRACE_API_URL': 'https://mock-dynatrace-url',
+        'DYNATRACE_API_TOKEN': 'mock-token',
+    }.get(key)
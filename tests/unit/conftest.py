@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.unit._fakes import fake_secret
+
+
+@pytest.fixture
+def fake_secrets_manager(mocker):
+    """Serve secrets_manager.get_secret_value from fake_secret for every client module."""
+    return mocker.patch('src.utils.secrets_manager.get_secret_value', side_effect=fake_secret)
+
+
+@pytest.fixture(scope="session")
+def check_results():
+    """Canonical _run_quality_checks results by name; treat them as read-only."""
+    return {
+        "all_pass": {"sonarqube": {"status": "SUCCESS"}, "wiz": {"status": "SUCCESS"}},
+        "wiz_fail": {"sonarqube": {"status": "SUCCESS"}, "wiz": {"status": "FAILURE", "message": "Critical CVE found"}},
+    }
+
+
+@pytest.fixture(autouse=True)
+def mock_print(monkeypatch):
+    """Replace print with a mock for every unit test; request it to assert on the messages."""
+    mock = MagicMock()
+    monkeypatch.setattr('builtins.print', mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def cached_secrets(monkeypatch):
+    """Start every unit test with an empty secrets cache, and restore the module's afterwards."""
+    monkeypatch.setattr('src.utils.secrets_manager.CACHED_SECRETS', None)
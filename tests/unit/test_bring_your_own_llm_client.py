@@ -1,134 +1,97 @@
-import unittest
-from unittest.mock import patch, MagicMock
 import json
-import urllib.request
 import urllib.error
+
+import pytest
+
 from src.llm_client.bring_your_own_llm_client import BringYourOwnLLMClient
+from tests._fast_mocks import UrlopenResponse
+
+# Canned urlopen responses, built once; they hold no per-test state
+_CANNED_RESPONSE = UrlopenResponse(b'{"response": "Test response"}')
+_INVALID_JSON_RESPONSE = UrlopenResponse(b"invalid json")
+
+# Transport errors urlopen raises, built once and re-raised by every case that uses them
+_URL_ERR = urllib.error.URLError("Connection failed")
+_HTTP_ERR = urllib.error.HTTPError(url="http://test", code=500, msg="Server Error", hdrs=None, fp=None)
+
+# Request payload test_call_request_parameters expects
+_EXPECTED_PAYLOAD = {
+    "messages": [{"role": "user", "content": "Test message"}],
+    "tools": [{"name": "tool1"}]
+}
+
+
+class _FakeUrlopen:
+    """urlopen stand-in that records each request, then returns or raises its outcome."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.requests = []
 
+    def __call__(self, request, timeout=None):
+        self.requests.append(request)
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
 
-class TestBringYourOwnLLMClient(unittest.TestCase):
+
+@pytest.fixture
+def fake_urlopen(monkeypatch):
+    """Install a _FakeUrlopen for the client; call the fixture with the outcome to serve."""
+    def install(outcome):
+        fake = _FakeUrlopen(outcome)
+        monkeypatch.setattr('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen', fake)
+        return fake
+    return install
+
+
+class TestBringYourOwnLLMClient:
 
     def test_init(self):
         """Test initialization of BringYourOwnLLMClient"""
         client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
-        self.assertEqual(client.api_key, "test-key")
-        self.assertEqual(client.api_endpoint, "http://api.test.com")
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_success(self, mock_urlopen):
-        """Test successful API call with bring your own LLM client"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({"response": "Test response"}).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        assert client.api_key == "test-key"
+        assert client.api_endpoint == "http://api.test.com"
+
+    @pytest.mark.parametrize("outcome, tools, exc, expected", [
+        (_CANNED_RESPONSE, [{"name": "test-tool"}], None, {"response": "Test response"}),
+        (_CANNED_RESPONSE, None, None, {"response": "Test response"}),
+        (_URL_ERR, None, urllib.error.URLError, None),
+        (_HTTP_ERR, None, urllib.error.HTTPError, None),
+        (_INVALID_JSON_RESPONSE, None, json.JSONDecodeError, None),
+    ], ids=["success", "no_tools", "url_error", "http_error", "json_decode_error"])
+    def test_call(self, fake_urlopen, outcome, tools, exc, expected):
+        """Test API calls that succeed, and that surface transport and decode errors"""
+        urlopen = fake_urlopen(outcome)
         client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
         messages = [{"role": "user", "content": "Hello"}]
-        tools = [{"name": "test-tool"}]
-        
-        result = client.call(messages, tools=tools)
-        
-        self.assertEqual(result, {"response": "Test response"})
-        mock_urlopen.assert_called_once()
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_request_parameters(self, mock_urlopen):
+
+        if exc is None:
+            assert client.call(messages, tools=tools) == expected
+        else:
+            with pytest.raises(exc):
+                client.call(messages, tools=tools)
+
+        assert len(urlopen.requests) == 1
+
+    def test_call_request_parameters(self, fake_urlopen):
         """Test that call method constructs request with correct parameters"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "response": "Test"
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        urlopen = fake_urlopen(_CANNED_RESPONSE)
+
         client = BringYourOwnLLMClient(
             api_key="custom-key", api_endpoint="http://custom-api.test.com"
         )
         messages = [{"role": "user", "content": "Test message"}]
         tools = [{"name": "tool1"}]
-        
+
         client.call(messages, tools=tools)
-        
-        # Verify the request was constructed correctly
-        call_args = mock_urlopen.call_args
-        request = call_args[0][0]
-        
-        # Check URL
-        self.assertEqual(request.full_url, "http://custom-api.test.com")
-        
-        # Check method
-        self.assertEqual(request.get_method(), "POST")
-        
-        # Check headers
-        self.assertEqual(request.headers["Content-type"], "application/json")
-        self.assertEqual(request.headers["Authorization"], "Bearer custom-key")
-        
-        # Check payload
-        payload = json.loads(request.data.decode('utf-8'))
-        expected_payload = {
-            "messages": messages,
-            "tools": tools
-        }
-        self.assertEqual(payload, expected_payload)
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_no_tools(self, mock_urlopen):
-        """Test API call without tools parameter"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "response": "Test"
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
-        client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
-        messages = [{"role": "user", "content": "Just a message"}]
-        
-        result = client.call(messages)
-        
-        self.assertEqual(result, {"response": "Test"})
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_url_error(self, mock_urlopen):
-        """Test API call with URL error"""
-        # Mock URL error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection failed")
-        
-        client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
-        messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(urllib.error.URLError):
-            client.call(messages)
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_http_error(self, mock_urlopen):
-        """Test API call with HTTP error"""
-        # Mock HTTP error
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            url="http://test", code=500, msg="Server Error", 
-            hdrs=None, fp=None
-        )
-        
-        client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
-        messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(urllib.error.HTTPError):
-            client.call(messages)
-
-    @patch('src.llm_client.bring_your_own_llm_client.urllib.request.urlopen')
-    def test_call_json_decode_error(self, mock_urlopen):
-        """Test API call with JSON decode error"""
-        # Mock response with invalid JSON
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"invalid json"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
-        client = BringYourOwnLLMClient(api_key="test-key", api_endpoint="http://api.test.com")
-        messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(json.JSONDecodeError):
-            client.call(messages)
 
+        # Verify the request was constructed correctly
+        request, = urlopen.requests
+        assert request.full_url == "http://custom-api.test.com"
+        assert request.get_method() == "POST"
+        assert request.headers["Content-type"] == "application/json"
+        assert request.headers["Authorization"] == "Bearer custom-key"
 
-if __name__ == '__main__':
-    unittest.main()
+        # Check payload
+        assert json.loads(request.data) == _EXPECTED_PAYLOAD
@@ -1,37 +1,84 @@
-import unittest
-from unittest.mock import patch, MagicMock
+import itertools
+import logging
+from unittest.mock import Mock
+
+import pytest
 import requests
-import time
+
 from src.connectors.dynatrace_client import DynatraceClient, trace_function
+from tests.unit._fakes import fake_secret
+
+
+# A 200 response shared by the module; spec'd so attributes are not built lazily
+_OK_RESPONSE = Mock(spec=requests.Response)
+_OK_RESPONSE.status_code = 200
+
+
+class _FakeHTTP:
+    """Stand-in for the requests module, injected through DynatraceClient(http=...)."""
+    post = Mock(return_value=_OK_RESPONSE)
+
+
+@pytest.fixture(scope="class")
+def dt_client():
+    """A client on the fake transport, built once per test class; the secrets are only
+    read during __init__."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('src.utils.secrets_manager.get_secret_value', fake_secret)
+        return DynatraceClient(http=_FakeHTTP)
+
+
+@pytest.fixture
+def fake_post():
+    """The fake transport's post(), cleared of calls and side effects from earlier tests."""
+    _FakeHTTP.post.reset_mock(side_effect=True)
+    _OK_RESPONSE.reset_mock()
+    return _FakeHTTP.post
 
 
-class TestDynatraceClient(unittest.TestCase):
+@pytest.fixture
+def mock_post(mocker):
+    """requests.post, for clients trace_function builds on the default transport."""
+    _OK_RESPONSE.reset_mock()
+    return mocker.patch('src.connectors.dynatrace_client.requests.post', return_value=_OK_RESPONSE)
 
-    @patch('src.connectors.dynatrace_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.dynatrace_client.requests.post')
-    @patch('builtins.print')
-    def test_send_event_success(self, mock_print, mock_post, mock_secrets):
+
+@pytest.fixture
+def dt_log(caplog):
+    """Capture the client module's log records, down to INFO."""
+    caplog.set_level(logging.INFO, logger='src.connectors.dynatrace_client')
+    return caplog
+
+
+@pytest.fixture
+def fake_clock(mocker):
+    """Replace the client module's time.time with a counter advancing 1.5 s per call."""
+    # Patch the module's own `time` name, not time.time itself: logging reads the
+    # real clock for every record it emits
+    clock = itertools.count(1000.0, 1.5)
+    mock_time = mocker.patch('src.connectors.dynatrace_client.time')
+    mock_time.time.side_effect = lambda: next(clock)
+    return mock_time.time
+
+
+def _sent_events(mock_post):
+    """The event payloads posted to Dynatrace, in order."""
+    return [call.kwargs['json'] for call in mock_post.call_args_list]
+
+
+class TestDynatraceClient:
+
+    def test_send_event_success(self, dt_client, fake_post, dt_log):
         """Test successful event sending"""
-        # Mock secrets
-        mock_secrets.side_effect = lambda k: {
-            'DYNATRACE_API_URL': 'https://mock-dynatrace-url',
-            'DYNATRACE_API_TOKEN': 'mock-token'
-        }[k]
-        
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
-        
         event_payload = {
             "eventType": "CUSTOM_INFO",
             "title": "Test Event",
             "entitySelector": "type(CUSTOM_DEVICE)"
         }
-        
-        DynatraceClient().send_event(event_payload)
-        
-        mock_post.assert_called_once_with(
+
+        dt_client.send_event(event_payload)
+
+        fake_post.assert_called_once_with(
             'https://mock-dynatrace-url/api/v2/events/ingest',
             headers={
                 "Authorization": "Api-Token mock-token",
@@ -40,117 +87,86 @@ class TestDynatraceClient(unittest.TestCase):
             json=event_payload,
             timeout=10
         )
-        mock_print.assert_called_with("Successfully sent event to Dynatrace: Test Event")
+        assert dt_log.messages[-1] == "Successfully sent event to Dynatrace: Test Event"
 
-    @patch('src.connectors.dynatrace_client.secrets_manager.get_secret_value')
-    def test_send_event_no_credentials(self, mock_secrets):
+    def test_send_event_no_credentials(self, mocker):
         """Test event sending when credentials are not configured"""
         # Mock missing secrets
-        mock_secrets.return_value = None
-        
+        mocker.patch('src.connectors.dynatrace_client.secrets_manager.get_secret_value', return_value=None)
+
         # Should raise ValueError when trying to initialize DynatraceClient
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(ValueError) as context:
             DynatraceClient()
-        
-        self.assertEqual(str(context.exception), "Dynatrace API URL or Token not configured.")
 
-    @patch('src.connectors.dynatrace_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.dynatrace_client.requests.post')
-    @patch('builtins.print')
-    def test_send_event_request_exception(self, mock_print, mock_post, mock_secrets):
+        assert str(context.value) == "Dynatrace API URL or Token not configured."
+
+    def test_send_event_request_exception(self, dt_client, fake_post, dt_log):
         """Test event sending with request exception"""
-        # Mock secrets
-        mock_secrets.side_effect = lambda k: {
-            'DYNATRACE_API_URL': 'https://mock-dynatrace-url',
-            'DYNATRACE_API_TOKEN': 'mock-token'
-        }[k]
-        
-        # Mock request exception
-        mock_post.side_effect = requests.exceptions.RequestException('Connection error')
-        
+        fake_post.side_effect = requests.exceptions.RequestException('Connection error')
+
         event_payload = {"title": "Test Event"}
-        
-        DynatraceClient().send_event(event_payload)
-        
-        mock_print.assert_called_with("Error sending event to Dynatrace: Connection error")
-
-    @patch('src.connectors.dynatrace_client.DynatraceClient.__init__', return_value=None)
-    @patch.object(DynatraceClient, 'send_event')
-    @patch('time.time')
-    def test_trace_function_success(self, mock_time, mock_send_event, mock_init):
+
+        dt_client.send_event(event_payload)
+
+        assert dt_log.messages[-1] == "Error sending event to Dynatrace: Connection error"
+
+    @pytest.mark.usefixtures("fake_secrets_manager", "fake_clock")
+    def test_trace_function_success(self, mock_post):
         """Test trace function decorator with successful execution"""
-        # Mock time progression
-        mock_time.side_effect = [1000.0, 1001.5]  # 1.5 seconds duration
-        
         @trace_function
         def test_function(repo_name):
             return "success result"
-        
+
         result = test_function("test-repo")
-        
-        self.assertEqual(result, "success result")
-        self.assertEqual(mock_send_event.call_count, 2)
-        
+
+        assert result == "success result"
+        start_call, finish_call = _sent_events(mock_post)
+
         # Check start event
-        start_call = mock_send_event.call_args_list[0][0][0]
-        self.assertEqual(start_call["eventType"], "CUSTOM_INFO")
-        self.assertEqual(start_call["title"], "Function Started: test_function")
-        self.assertEqual(start_call["properties"]["status"], "STARTED")
-        
+        assert start_call["eventType"] == "CUSTOM_INFO"
+        assert start_call["title"] == "Function Started: test_function"
+        assert start_call["properties"]["status"] == "STARTED"
+
         # Check finish event
-        finish_call = mock_send_event.call_args_list[1][0][0]
-        self.assertEqual(finish_call["eventType"], "CUSTOM_INFO")
-        self.assertEqual(finish_call["title"], "Function Finished: test_function")
-        self.assertEqual(finish_call["properties"]["status"], "SUCCESS")
-        self.assertEqual(finish_call["properties"]["duration_ms"], 1500.0)
-
-    @patch('src.connectors.dynatrace_client.DynatraceClient.__init__', return_value=None)
-    @patch.object(DynatraceClient, 'send_event')
-    @patch('time.time')
-    @patch('builtins.print')
-    def test_trace_function_failure(self, mock_print, mock_time, mock_send_event, mock_init):
+        assert finish_call["eventType"] == "CUSTOM_INFO"
+        assert finish_call["title"] == "Function Finished: test_function"
+        assert finish_call["properties"]["status"] == "SUCCESS"
+        assert finish_call["properties"]["duration_ms"] == 1500.0
+
+    @pytest.mark.usefixtures("fake_secrets_manager", "fake_clock")
+    def test_trace_function_failure(self, mock_post, dt_log):
         """Test trace function decorator with function failure"""
-        # Mock time progression
-        mock_time.side_effect = [1000.0, 1001.0]  # 1 second duration
-        
         @trace_function
         def failing_function(repo_name):
             raise ValueError("Test error")
-        
-        with self.assertRaises(ValueError):
+
+        with pytest.raises(ValueError):
             failing_function("test-repo")
-        
-        self.assertEqual(mock_send_event.call_count, 2)
-        
+
+        start_call, fail_call = _sent_events(mock_post)
+
         # Check start event
-        start_call = mock_send_event.call_args_list[0][0][0]
-        self.assertEqual(start_call["properties"]["status"], "STARTED")
-        
+        assert start_call["properties"]["status"] == "STARTED"
+
         # Check fail event
-        fail_call = mock_send_event.call_args_list[1][0][0]
-        self.assertEqual(fail_call["eventType"], "CUSTOM_ERROR")
-        self.assertEqual(fail_call["title"], "Function Failed: failing_function")
-        self.assertEqual(fail_call["properties"]["status"], "FAILURE")
-        self.assertEqual(fail_call["properties"]["error_message"], "Test error")
-        
-        mock_print.assert_called_with("Function failing_function failed with error: Test error")
-
-    @patch('src.connectors.dynatrace_client.DynatraceClient.__init__', return_value=None)
-    @patch.object(DynatraceClient, 'send_event')
-    def test_trace_function_no_args(self, mock_send_event, mock_init):
+        assert fail_call["eventType"] == "CUSTOM_ERROR"
+        assert fail_call["title"] == "Function Failed: failing_function"
+        assert fail_call["properties"]["status"] == "FAILURE"
+        assert fail_call["properties"]["error_message"] == "Test error"
+
+        assert "Function failing_function failed with error: Test error" in dt_log.messages
+
+    @pytest.mark.usefixtures("fake_secrets_manager", "fake_clock")
+    def test_trace_function_no_args(self, mock_post):
         """Test trace function decorator with no arguments"""
         @trace_function
         def no_args_function():
             return "result"
-        
+
         result = no_args_function()
-        
-        self.assertEqual(result, "result")
-        
-        # Check that repo_name defaults to 'N/A'
-        start_call = mock_send_event.call_args_list[0][0][0]
-        self.assertEqual(start_call["properties"]["application"], "N/A")
 
+        assert result == "result"
 
-if __name__ == '__main__':
-    unittest.main()
+        # Check that repo_name defaults to 'N/A'
+        start_call = _sent_events(mock_post)[0]
+        assert start_call["properties"]["application"] == "N/A"
@@ -1,93 +1,55 @@
-import unittest
-from unittest.mock import patch, MagicMock
-import json
-from src import main
+import pytest
 
-class TestGateHandler(unittest.TestCase):
+from tests import _json
 
-    @patch('src.main.load_config')
-    @patch('src.main._run_quality_checks')
-    @patch('src.main.dynatrace_client.DynatraceClient')
-    @patch('src.main.slack_client.SlackClient')
-    def test_gate_pass(self, mock_slack_class, mock_dynatrace_class, mock_checks, mock_config):
-        """
-        Test that the gate passes when all checks are successful.
-        """
-        # Mock the client instances
-        mock_dynatrace_instance = MagicMock()
-        mock_dynatrace_class.return_value = mock_dynatrace_instance
-        mock_slack_instance = MagicMock()
-        mock_slack_class.return_value = mock_slack_instance
-        
-        # Mock configuration
-        mock_config.return_value = {
-            "gating_rules": {
-                "weights": {"sonarqube": 50, "wiz": 40, "tests": 10},
-                "promotion_threshold": 90
-            }
-        }
-        # Mock successful checks
-        mock_checks.return_value = {
-            "sonarqube": {"status": "SUCCESS"},
-            "wiz": {"status": "SUCCESS"}
-        }
-        
-        event = {
-            'body': json.dumps({
-                "application": {"name": "test-app", "commit_sha": "abc", "artifact_id": "123"},
-            })
-        }
-        
-        response = main.gate_handler(event, None)
-        
-        self.assertEqual(response['statusCode'], 200)
-        body = json.loads(response['body'])
-        self.assertEqual(body['status'], 'SUCCESS')
-        self.assertEqual(body['score'], 100)
-        mock_dynatrace_instance.send_event.assert_called_once()
-        mock_slack_instance.send_notification.assert_not_called()
+_GATE_CONFIG = {
+    "gating_rules": {
+        "weights": {"sonarqube": 50, "wiz": 40, "tests": 10},
+        "promotion_threshold": 90
+    }
+}
+
+# Serialized once at import; the handler only reads the event
+_GATE_EVENT_BODY = _json.dumps({
+    "application": {"name": "test-app", "commit_sha": "abc", "artifact_id": "123"},
+})
+_GATE_EVENT = {'body': _GATE_EVENT_BODY}
+
+
+@pytest.fixture(autouse=True)
+def gate_mocks(mocker):
+    """Patch the handler's config, checks and clients; returns (checks, dynatrace, slack)."""
+    mocker.patch('src.main.load_config', return_value=_GATE_CONFIG)
+    return (
+        mocker.patch('src.main._run_quality_checks'),
+        mocker.patch('src.main.dynatrace_client.DynatraceClient').return_value,
+        mocker.patch('src.main.slack_client.SlackClient').return_value,
+    )
 
-    @patch('src.main.load_config')
-    @patch('src.main._run_quality_checks')
-    @patch('src.main.dynatrace_client.DynatraceClient')
-    @patch('src.main.slack_client.SlackClient')
-    def test_gate_fail_on_score(self, mock_slack_class, mock_dynatrace_class, mock_checks, mock_config):
+
+class TestGateHandler:
+
+    @pytest.mark.parametrize("checks, expected_status, expected_score, expected_issue", [
+        pytest.param("all_pass", "SUCCESS", 100, None, id="all_pass"),
+        # 50 for sonar + 10 for tests
+        pytest.param("wiz_fail", "FAILURE", 60, "Wiz failed: Critical CVE found", id="wiz_fail"),
+    ])
+    def test_gate(self, sre_main, gate_mocks, check_results, checks, expected_status, expected_score, expected_issue):
         """
-        Test that the gate fails when the score is below the threshold.
+        Test that the gate passes when all checks succeed and fails when the score is below the threshold.
         """
-        # Mock the client instances
-        mock_dynatrace_instance = MagicMock()
-        mock_dynatrace_class.return_value = mock_dynatrace_instance
-        mock_slack_instance = MagicMock()
-        mock_slack_class.return_value = mock_slack_instance
-        
-        mock_config.return_value = {
-            "gating_rules": {
-                "weights": {"sonarqube": 50, "wiz": 40, "tests": 10},
-                "promotion_threshold": 90
-            }
-        }
-        # Mock a failed check
-        mock_checks.return_value = {
-            "sonarqube": {"status": "SUCCESS"},
-            "wiz": {"status": "FAILURE", "message": "Critical CVE found"}
-        }
-        
-        event = {
-            'body': json.dumps({
-                "application": {"name": "test-app", "commit_sha": "abc", "artifact_id": "123"},
-            })
-        }
-        
-        response = main.gate_handler(event, None)
-        
-        self.assertEqual(response['statusCode'], 200)
-        body = json.loads(response['body'])
-        self.assertEqual(body['status'], 'FAILURE')
-        self.assertEqual(body['score'], 60) # 50 for sonar + 10 for tests
-        self.assertIn("Wiz failed: Critical CVE found", body['issues'])
-        mock_dynatrace_instance.send_event.assert_called_once()
-        mock_slack_instance.send_notification.assert_called_once()
+        mock_checks, mock_dynatrace_instance, mock_slack_instance = gate_mocks
+        mock_checks.return_value = check_results[checks]
 
-if __name__ == '__main__':
-    unittest.main()
+        response = sre_main.gate_handler(_GATE_EVENT, None)
+
+        assert response['statusCode'] == 200
+        body = _json.loads(response['body'])
+        assert body['status'] == expected_status
+        assert body['score'] == expected_score
+        mock_dynatrace_instance.send_event.assert_called_once()
+        if expected_issue is None:
+            mock_slack_instance.send_notification.assert_not_called()
+        else:
+            assert expected_issue in body['issues']
+            mock_slack_instance.send_notification.assert_called_once()
@@ -1,29 +1,43 @@
-import unittest
-from unittest.mock import patch, MagicMock
 import json
 import urllib.request
 import urllib.error
+
+import pytest
+
 from src.llm_client.ollama_client import OllamaClient
+from tests._fast_mocks import UrlopenResponse
+
+# Canned urlopen responses, built once; tests only name the body they need
+_CHAT_RESPONSE = UrlopenResponse(b'{"message": {"role": "assistant", "content": "Test response"}}')
+_TOOL_RESPONSE = UrlopenResponse(b'{"message": {"role": "assistant", "content": "Tool response"}}')
+_SHORT_RESPONSE = UrlopenResponse(b'{"message": {"role": "assistant", "content": "Test"}}')
+_NO_MESSAGE = UrlopenResponse(b'{"other_field": "value"}')
+_INVALID_JSON = UrlopenResponse(b"invalid json")
+
 
+@pytest.fixture
+def mock_urlopen(mocker):
+    """Patch urlopen as the Ollama client sees it."""
+    return mocker.patch('src.llm_client.ollama_client.urllib.request.urlopen')
 
-class TestOllamaClient(unittest.TestCase):
 
-    def test_init_with_defaults(self):
+class TestOllamaClient:
+
+    def test_init_with_defaults(self, monkeypatch):
         """Test OllamaClient initialization with default values"""
-        with patch.dict('os.environ', {}, clear=True):
-            client = OllamaClient()
-            self.assertEqual(client.api_endpoint, "http://localhost:11434/api/chat")
-            self.assertEqual(client.model, "codellama:13b")
+        monkeypatch.delenv('OLLAMA_API_ENDPOINT', raising=False)
+        monkeypatch.delenv('OLLAMA_MODEL', raising=False)
+        client = OllamaClient()
+        assert client.api_endpoint == "http://localhost:11434/api/chat"
+        assert client.model == "codellama:13b"
 
-    def test_init_with_environment_variables(self):
+    def test_init_with_environment_variables(self, monkeypatch):
         """Test OllamaClient initialization with environment variables"""
-        with patch.dict('os.environ', {
-            'OLLAMA_API_ENDPOINT': 'http://custom-endpoint:8080/api/chat',
-            'OLLAMA_MODEL': 'custom-model:7b'
-        }):
-            client = OllamaClient()
-            self.assertEqual(client.api_endpoint, "http://custom-endpoint:8080/api/chat")
-            self.assertEqual(client.model, "custom-model:7b")
+        monkeypatch.setenv('OLLAMA_API_ENDPOINT', 'http://custom-endpoint:8080/api/chat')
+        monkeypatch.setenv('OLLAMA_MODEL', 'custom-model:7b')
+        client = OllamaClient()
+        assert client.api_endpoint == "http://custom-endpoint:8080/api/chat"
+        assert client.model == "custom-model:7b"
 
     def test_init_with_explicit_parameters(self):
         """Test OllamaClient initialization with explicit parameters"""
@@ -31,145 +45,91 @@ class TestOllamaClient(unittest.TestCase):
             api_endpoint="http://explicit-endpoint:9000/api/chat",
             model="explicit-model:latest"
         )
-        self.assertEqual(client.api_endpoint, "http://explicit-endpoint:9000/api/chat")
-        self.assertEqual(client.model, "explicit-model:latest")
+        assert client.api_endpoint == "http://explicit-endpoint:9000/api/chat"
+        assert client.model == "explicit-model:latest"
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
     def test_call_success_without_tools(self, mock_urlopen):
         """Test successful API call without tools"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "message": {"role": "assistant", "content": "Test response"}
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        mock_urlopen.return_value = _CHAT_RESPONSE
+
         client = OllamaClient()
         messages = [{"role": "user", "content": "Hello"}]
-        
+
         result = client.call(messages)
-        
-        self.assertEqual(result, {"role": "assistant", "content": "Test response"})
+
+        assert result == {"role": "assistant", "content": "Test response"}
         mock_urlopen.assert_called_once()
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
     def test_call_success_with_tools(self, mock_urlopen):
         """Test successful API call with tools"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "message": {"role": "assistant", "content": "Tool response"}
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        mock_urlopen.return_value = _TOOL_RESPONSE
+
         client = OllamaClient()
         messages = [{"role": "user", "content": "Use tools"}]
         tools = [{"name": "test_tool", "description": "A test tool"}]
-        
+
         result = client.call(messages, tools=tools)
-        
-        self.assertEqual(result, {"role": "assistant", "content": "Tool response"})
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
-    def test_call_request_parameters(self, mock_urlopen):
+        assert result == {"role": "assistant", "content": "Tool response"}
+
+    def test_call_request_parameters(self, mocker, mock_urlopen):
         """Test that call method constructs request with correct parameters"""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "message": {"role": "assistant", "content": "Test"}
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        mock_urlopen.return_value = _SHORT_RESPONSE
+
         client = OllamaClient(
             api_endpoint="http://test-endpoint:8080/api/chat",
             model="test-model:latest"
         )
+        build_request = mocker.spy(client, '_build_request')
         messages = [{"role": "user", "content": "Test message"}]
         tools = [{"name": "tool1"}]
-        
+
         client.call(messages, tools=tools)
-        
-        # Verify the request was constructed correctly
-        call_args = mock_urlopen.call_args
-        request = call_args[0][0]
-        
-        # Check URL
-        self.assertEqual(request.full_url, "http://test-endpoint:8080/api/chat")
-        
-        # Check method
-        self.assertEqual(request.get_method(), "POST")
-        
-        # Check headers
-        self.assertEqual(request.headers["Content-type"], "application/json")
-        
-        # Check payload
-        payload = json.loads(request.data.decode('utf-8'))
-        expected_payload = {
+
+        # The payload is compared as built, before serialization
+        build_request.assert_called_once_with({
             "model": "test-model:latest",
             "messages": messages,
             "stream": False,
             "tools": tools
-        }
-        self.assertEqual(payload, expected_payload)
+        })
+
+        # The request that went out is the one _build_request returned
+        request = mock_urlopen.call_args[0][0]
+        assert request is build_request.spy_return
+        assert request.full_url == "http://test-endpoint:8080/api/chat"
+        assert request.get_method() == "POST"
+        assert request.headers["Content-type"] == "application/json"
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
     def test_call_no_message_in_response(self, mock_urlopen):
         """Test API call when response has no message field"""
-        # Mock response without message field
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
-            "other_field": "value"
-        }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
-        client = OllamaClient()
-        messages = [{"role": "user", "content": "Hello"}]
-        
-        result = client.call(messages)
-        
-        self.assertEqual(result, {})
-
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
-    def test_call_url_error(self, mock_urlopen):
-        """Test API call with URL error"""
-        # Mock URL error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection failed")
-        
+        mock_urlopen.return_value = _NO_MESSAGE
+
         client = OllamaClient()
         messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(urllib.error.URLError):
-            client.call(messages)
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
-    def test_call_http_error(self, mock_urlopen):
-        """Test API call with HTTP error"""
-        # Mock HTTP error
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            url="http://test", code=500, msg="Server Error", 
-            hdrs=None, fp=None
-        )
-        
+        assert client.call(messages) == {}
+
+    @pytest.mark.parametrize("error", [
+        urllib.error.URLError("Connection failed"),
+        urllib.error.HTTPError(url="http://test", code=500, msg="Server Error", hdrs=None, fp=None),
+    ], ids=["url_error", "http_error"])
+    def test_call_transport_error(self, mock_urlopen, error):
+        """Test API calls surface URL and HTTP errors"""
+        mock_urlopen.side_effect = error
+
         client = OllamaClient()
         messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(urllib.error.HTTPError):
+
+        with pytest.raises(type(error)):
             client.call(messages)
 
-    @patch('src.llm_client.ollama_client.urllib.request.urlopen')
     def test_call_json_decode_error(self, mock_urlopen):
         """Test API call with JSON decode error"""
-        # Mock response with invalid JSON
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"invalid json"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
+        mock_urlopen.return_value = _INVALID_JSON
+
         client = OllamaClient()
         messages = [{"role": "user", "content": "Hello"}]
-        
-        with self.assertRaises(json.JSONDecodeError):
-            client.call(messages)
-
 
-if __name__ == '__main__':
-    unittest.main()
+        with pytest.raises(json.JSONDecodeError):
+            client.call(messages)
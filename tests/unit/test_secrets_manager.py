@@ -1,139 +1,133 @@
-import unittest
-from unittest.mock import patch, MagicMock
+import importlib
+import sys
+from unittest.mock import MagicMock
 import json
+
 import boto3
-from src.utils.secrets_manager import get_secret, get_secret_value, CACHED_SECRETS
+import pytest
+
+from src.utils import secrets_manager as _sm
+from src.utils.secrets_manager import get_secret, get_secret_value
+
+# Secret payload served by the mocked client, encoded once at import
+_SECRET_DATA = {"key1": "value1", "key2": "value2"}
+_SECRET_STRING = json.dumps(_SECRET_DATA)
+
+
+@pytest.fixture(scope="module")
+def _boto_client_patch():
+    """boto3.client replaced by one MagicMock for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mock = MagicMock()
+        mp.setattr(boto3, 'client', mock)
+        yield mock
 
 
-class TestSecretsManager(unittest.TestCase):
+@pytest.fixture
+def mock_boto_client(_boto_client_patch):
+    """The module's boto3.client mock, cleared of calls, return value and side effect."""
+    _boto_client_patch.reset_mock(return_value=True, side_effect=True)
+    return _boto_client_patch
 
-    def setUp(self):
-        """Clear cached secrets before each test"""
-        import src.utils.secrets_manager
-        src.utils.secrets_manager.CACHED_SECRETS = None
 
-    @patch('src.utils.secrets_manager.boto3.client')
-    @patch('builtins.print')
-    def test_get_secret_success(self, mock_print, mock_boto_client):
+@pytest.fixture
+def secret_name(monkeypatch):
+    """Configure SECRETS_MANAGER_NAME for get_secret_value."""
+    monkeypatch.setenv('SECRETS_MANAGER_NAME', 'test-secret-name')
+    return 'test-secret-name'
+
+
+class TestGetSecret:
+
+    def test_get_secret_success(self, mock_boto_client, mock_print):
         """Test successful secret retrieval"""
         # Mock AWS client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
-        
+
         # Mock response
-        secret_data = {"key1": "value1", "key2": "value2"}
-        mock_client.get_secret_value.return_value = {
-            'SecretString': json.dumps(secret_data)
-        }
-        
+        mock_client.get_secret_value.return_value = {'SecretString': _SECRET_STRING}
+
         result = get_secret("test-secret")
-        
-        self.assertEqual(result, secret_data)
+
+        assert result == _SECRET_DATA
         mock_boto_client.assert_called_once_with('secretsmanager')
         mock_client.get_secret_value.assert_called_once_with(SecretId="test-secret")
         mock_print.assert_any_call("Fetching secret 'test-secret' from AWS Secrets Manager...")
         mock_print.assert_any_call("Successfully fetched and cached secrets.")
 
-    @patch('src.utils.secrets_manager.boto3.client')
-    @patch('builtins.print')
-    def test_get_secret_cached(self, mock_print, mock_boto_client):
+    def test_get_secret_cached(self, mock_boto_client):
         """Test that cached secrets are returned without API call"""
-        # Set up cached secrets
-        import src.utils.secrets_manager
+        # Set up cached secrets; conftest resets CACHED_SECRETS after the test
         cached_data = {"cached_key": "cached_value"}
-        src.utils.secrets_manager.CACHED_SECRETS = cached_data
-        
+        _sm.CACHED_SECRETS = cached_data
+
         result = get_secret("test-secret")
-        
-        self.assertEqual(result, cached_data)
+
+        # The cache is returned by reference, not copied
+        assert result is cached_data
         mock_boto_client.assert_not_called()
 
-    @patch('src.utils.secrets_manager.boto3.client')
-    @patch('builtins.print')
-    def test_get_secret_exception(self, mock_print, mock_boto_client):
+    def test_get_secret_exception(self, mock_boto_client, mock_print):
         """Test secret retrieval with exception"""
         # Mock AWS client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
-        
+
         # Mock exception
         mock_client.get_secret_value.side_effect = Exception("AWS error")
-        
+
         result = get_secret("test-secret")
-        
-        self.assertEqual(result, {})
+
+        assert result == {}
         mock_print.assert_any_call("Fetching secret 'test-secret' from AWS Secrets Manager...")
         mock_print.assert_any_call("FATAL: Could not retrieve secrets from AWS Secrets Manager: AWS error")
 
-    @patch('src.utils.secrets_manager.os.environ.get')
-    @patch('src.utils.secrets_manager.get_secret')
-    def test_get_secret_value_success(self, mock_get_secret, mock_env):
-        """Test successful secret value retrieval"""
-        # Mock environment variable
-        mock_env.return_value = "test-secret-name"
-        
-        # Mock secret data
-        secret_data = {"api_key": "secret123", "db_password": "dbpass456"}
-        mock_get_secret.return_value = secret_data
-        
-        result = get_secret_value("api_key")
-        
-        self.assertEqual(result, "secret123")
-        mock_get_secret.assert_called_once_with("test-secret-name")
-
-    @patch('src.utils.secrets_manager.os.environ.get')
-    @patch('src.utils.secrets_manager.get_secret')
-    def test_get_secret_value_with_default(self, mock_get_secret, mock_env):
-        """Test secret value retrieval with default value"""
-        # Mock environment variable
-        mock_env.return_value = "test-secret-name"
-        
-        # Mock secret data without the requested key
-        secret_data = {"other_key": "other_value"}
-        mock_get_secret.return_value = secret_data
-        
-        result = get_secret_value("missing_key", "default_value")
-        
-        self.assertEqual(result, "default_value")
-
-    @patch('src.utils.secrets_manager.os.environ.get')
-    def test_get_secret_value_no_secret_name(self, mock_env):
-        """Test secret value retrieval when secret name is not configured"""
-        # Mock missing environment variable
-        mock_env.return_value = None
-        
-        result = get_secret_value("api_key", "default_value")
-        
-        self.assertEqual(result, "default_value")
-
-    @patch('src.utils.secrets_manager.os.environ.get')
-    def test_get_secret_value_no_secret_name_no_default(self, mock_env):
-        """Test secret value retrieval when secret name is not configured and no default"""
-        # Mock missing environment variable
-        mock_env.return_value = None
-        
-        result = get_secret_value("api_key")
-        
-        self.assertIsNone(result)
-
-    @patch('src.utils.secrets_manager.boto3.client')
-    @patch('builtins.print')
-    def test_get_secret_invalid_json(self, mock_print, mock_boto_client):
+    def test_get_secret_invalid_json(self, mock_boto_client, mock_print):
         """Test secret retrieval with invalid JSON"""
         # Mock AWS client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
-        
+
         # Mock response with invalid JSON
         mock_client.get_secret_value.return_value = {
             'SecretString': 'invalid json string'
         }
-        
+
         result = get_secret("test-secret")
-        
-        self.assertEqual(result, {})
+
+        assert result == {}
         mock_print.assert_any_call("Fetching secret 'test-secret' from AWS Secrets Manager...")
 
+    def test_import_does_not_load_boto3(self, monkeypatch):
+        """Test that importing secrets_manager leaves boto3 unloaded until a secret is fetched"""
+        # Other tests may already have imported boto3; monkeypatch puts it back afterwards
+        monkeypatch.delitem(sys.modules, 'boto3', raising=False)
+        importlib.reload(_sm)
+
+        assert 'boto3' not in sys.modules
+
+
+class TestGetSecretValue:
+
+    def test_get_secret_value_success(self, mocker, secret_name):
+        """Test successful secret value retrieval"""
+        mock_get_secret = mocker.patch('src.utils.secrets_manager.get_secret',
+                                       return_value={"api_key": "secret123", "db_password": "dbpass456"})
+
+        assert get_secret_value("api_key") == "secret123"
+        mock_get_secret.assert_called_once_with(secret_name)
+
+    def test_get_secret_value_with_default(self, mocker, secret_name):
+        """Test secret value retrieval with default value"""
+        # Secret data without the requested key
+        mocker.patch('src.utils.secrets_manager.get_secret', return_value={"other_key": "other_value"})
+
+        assert get_secret_value("missing_key", "default_value") == "default_value"
+
+    @pytest.mark.parametrize("default", ["default_value", None], ids=["default", "no_default"])
+    def test_get_secret_value_no_secret_name(self, monkeypatch, default):
+        """Test secret value retrieval when secret name is not configured"""
+        monkeypatch.delenv('SECRETS_MANAGER_NAME', raising=False)
 
-if __name__ == '__main__':
-    unittest.main()
+        assert get_secret_value("api_key", default) is default
@@ -1,97 +1,84 @@
-import unittest
-from unittest.mock import patch, MagicMock
-import requests
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.connectors import slack_client
 from src.connectors.slack_client import SlackClient
+from tests.unit._fakes import CONN_ERR, HTTP_404, build_client
+
+
+_WEBHOOK_URL = 'https://hooks.slack.com/services/test/webhook/url'
+
+
+@pytest.fixture(scope="class")
+def client():
+    """A SlackClient posting to the test webhook, shared by the tests in a class."""
+    return build_client(SlackClient, {'SLACK_WEBHOOK_URL': _WEBHOOK_URL})
 
 
-class TestSlackClient(unittest.TestCase):
+@pytest.fixture
+def mock_post(mocker):
+    return mocker.patch.object(slack_client.requests, 'post')
 
-    @patch('src.connectors.slack_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.slack_client.requests.post')
-    def test_send_notification_success(self, mock_post, mock_secret):
+
+class TestSlackClient:
+    """send_notification on one client per class; only requests.post is patched per test"""
+
+    def test_send_notification_success(self, client, mock_post):
         """Test successful notification sending"""
-        # Mock secret manager
-        mock_secret.return_value = 'https://hooks.slack.com/services/test/webhook/url'
-        
         # Mock successful response
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_post.return_value = mock_response
-        
+
         payload = {"text": "Test notification"}
-        
+
         # Should not raise any exception
-        SlackClient().send_notification(payload)
-        
+        client.send_notification(payload)
+
         mock_post.assert_called_once_with(
-            'https://hooks.slack.com/services/test/webhook/url',
+            _WEBHOOK_URL,
             json=payload,
             timeout=10
         )
         mock_response.raise_for_status.assert_called_once()
 
-    @patch('src.connectors.slack_client.secrets_manager.get_secret_value')
-    def test_send_notification_no_webhook_url(self, mock_secret):
-        """Test notification when webhook URL is not configured"""
-        # Mock missing secret
-        mock_secret.return_value = None
-        
-        # Should raise ValueError when trying to initialize SlackClient
-        with self.assertRaises(ValueError) as context:
-            SlackClient()
-        
-        self.assertEqual(str(context.exception), "SLACK_WEBHOOK_URL not configured.")
-
-    @patch('src.connectors.slack_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.slack_client.requests.post')
-    @patch('builtins.print')
-    def test_send_notification_request_exception(self, mock_print, mock_post, mock_secret):
+    def test_send_notification_request_exception(self, client, mock_post, mock_print):
         """Test notification with request exception"""
-        # Mock secret manager
-        mock_secret.return_value = 'https://hooks.slack.com/services/test/webhook/url'
-        
         # Mock request exception
-        mock_post.side_effect = requests.exceptions.RequestException('Connection error')
-        
+        mock_post.side_effect = CONN_ERR
+
         payload = {"text": "Test notification"}
-        
-        SlackClient().send_notification(payload)
-        
+
+        client.send_notification(payload)
+
         # Should print error message
         mock_print.assert_called_with("Error sending notification to Slack: Connection error")
 
-    @patch('src.connectors.slack_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.slack_client.requests.post')
-    @patch('builtins.print')
-    def test_send_notification_http_error(self, mock_print, mock_post, mock_secret):
+    def test_send_notification_http_error(self, client, mock_post, mock_print):
         """Test notification with HTTP error"""
-        # Mock secret manager
-        mock_secret.return_value = 'https://hooks.slack.com/services/test/webhook/url'
-        
         # Mock HTTP error
         mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError('404 Not Found')
+        mock_response.raise_for_status.side_effect = HTTP_404
         mock_post.return_value = mock_response
-        
+
         payload = {"text": "Test notification"}
-        
-        SlackClient().send_notification(payload)
-        
+
+        client.send_notification(payload)
+
         # Should print error message
         mock_print.assert_called_with("Error sending notification to Slack: 404 Not Found")
 
-    @patch('src.connectors.slack_client.secrets_manager.get_secret_value')
-    def test_send_notification_empty_webhook_url(self, mock_secret):
-        """Test notification with empty webhook URL"""
-        # Mock empty secret
-        mock_secret.return_value = ""
-        
-        # Should raise ValueError when trying to initialize SlackClient
-        with self.assertRaises(ValueError) as context:
-            SlackClient()
-        
-        self.assertEqual(str(context.exception), "SLACK_WEBHOOK_URL not configured.")
 
+class TestSlackClientInit:
+    """Constructor checks, kept apart from the shared client above"""
+
+    @pytest.mark.parametrize("webhook_url", [None, ""], ids=["no_webhook_url", "empty_webhook_url"])
+    def test_missing_webhook_url(self, mocker, webhook_url):
+        """Test that initialization fails when the webhook URL is missing or empty"""
+        mocker.patch.object(slack_client.secrets_manager, 'get_secret_value', return_value=webhook_url)
+
+        with pytest.raises(ValueError) as context:
+            SlackClient()
 
-if __name__ == '__main__':
-    unittest.main()
+        assert str(context.value) == "SLACK_WEBHOOK_URL not configured."
@@ -1,131 +1,102 @@
-import unittest
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
+
+import pytest
 import requests
+
+from src.connectors import sonarqube_client
 from src.connectors.sonarqube_client import SonarQubeClient
+from tests._fast_mocks import JsonResponse
+from tests.unit._fakes import CONN_ERR, HTTP_404, build_client
+
+_SONAR_SECRETS = {'SONAR_API_URL': 'http://mock-sonar-url', 'SONAR_API_TOKEN': 'mock-token'}
 
+# A failed quality gate with two error conditions, built once and read-only so tests can share it
+_FAIL_BODY = MappingProxyType({
+    "projectStatus": MappingProxyType({
+        "status": "ERROR",
+        "conditions": (
+            MappingProxyType({
+                "status": "ERROR",
+                "metricKey": "coverage",
+                "actualValue": "80",
+                "errorThreshold": "90"
+            }),
+            MappingProxyType({
+                "status": "ERROR",
+                "metricKey": "bugs",
+                "actualValue": "5",
+                "errorThreshold": "0"
+            }),
+        )
+    })
+})
+_FAIL_RESPONSE = JsonResponse(_FAIL_BODY)
+# Metric names and values the failure message must mention
+_FAIL_TOKENS = ("coverage", "bugs", "80", "90")
 
-class TestSonarQubeClient(unittest.TestCase):
 
-    @patch('src.connectors.sonarqube_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.sonarqube_client.requests.get')
-    def test_quality_gate_pass(self, mock_get, mock_secrets):
-        """Test successful quality gate status"""
-        # Mock the secrets
-        mock_secrets.side_effect = lambda k: {
-            'SONAR_API_URL': 'http://mock-sonar-url',
-            'SONAR_API_TOKEN': 'mock-token'
-        }[k]
+@pytest.fixture(scope="class")
+def client():
+    """A SonarQubeClient for the mock Sonar server, shared by the tests in a class."""
+    return build_client(SonarQubeClient, _SONAR_SECRETS)
 
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch.object(sonarqube_client.requests, 'get')
+
+
+class TestSonarQubeClient:
+    """get_quality_gate_status on one client per class; only requests.get is patched per test"""
+
+    def test_quality_gate_pass(self, client, mock_get):
+        """Test successful quality gate status"""
         # Mock the API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = JsonResponse({
             "projectStatus": {"status": "OK"}
-        }
-        mock_get.return_value = mock_response
+        })
+
+        result = client.get_quality_gate_status('mock-project')
 
-        result = SonarQubeClient().get_quality_gate_status('mock-project')
-        
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['message'], 'SonarQube Quality Gate passed.')
+        assert result['status'] == 'SUCCESS'
+        assert result['message'] == 'SonarQube Quality Gate passed.'
         mock_get.assert_called_once()
 
-    @patch('src.connectors.sonarqube_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.sonarqube_client.requests.get')
-    def test_quality_gate_fail_with_conditions(self, mock_get, mock_secrets):
+    def test_quality_gate_fail_with_conditions(self, client, mock_get):
         """Test failed quality gate with error conditions"""
-        # Mock the secrets
-        mock_secrets.side_effect = lambda k: {
-            'SONAR_API_URL': 'http://mock-sonar-url',
-            'SONAR_API_TOKEN': 'mock-token'
-        }[k]
-
         # Mock the API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "projectStatus": {
-                "status": "ERROR",
-                "conditions": [{
-                    "status": "ERROR",
-                    "metricKey": "coverage",
-                    "actualValue": "80",
-                    "errorThreshold": "90"
-                }, {
-                    "status": "ERROR",
-                    "metricKey": "bugs",
-                    "actualValue": "5",
-                    "errorThreshold": "0"
-                }]
-            }
-        }
-        mock_get.return_value = mock_response
-
-        result = SonarQubeClient().get_quality_gate_status('mock-project')
-        
-        self.assertEqual(result['status'], 'FAILURE')
-        self.assertIn("coverage", result['message'])
-        self.assertIn("bugs", result['message'])
-        self.assertIn("80", result['message'])
-        self.assertIn("90", result['message'])
-
-    @patch('src.connectors.sonarqube_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.sonarqube_client.requests.get')
-    def test_quality_gate_unknown_status(self, mock_get, mock_secrets):
-        """Test quality gate with unknown status"""
-        # Mock the secrets
-        mock_secrets.side_effect = lambda k: {
-            'SONAR_API_URL': 'http://mock-sonar-url',
-            'SONAR_API_TOKEN': 'mock-token'
-        }[k]
+        mock_get.return_value = _FAIL_RESPONSE
 
+        result = client.get_quality_gate_status('mock-project')
+
+        assert result['status'] == 'FAILURE'
+        message = result['message']
+        assert all(token in message for token in _FAIL_TOKENS), message
+
+    def test_quality_gate_unknown_status(self, client, mock_get):
+        """Test quality gate with unknown status"""
         # Mock the API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = JsonResponse({
             "projectStatus": {"status": "UNKNOWN"}
-        }
-        mock_get.return_value = mock_response
+        })
 
-        result = SonarQubeClient().get_quality_gate_status('mock-project')
-        
-        self.assertEqual(result['status'], 'FAILURE')
-        self.assertIn("UNKNOWN", result['message'])
+        result = client.get_quality_gate_status('mock-project')
 
-    @patch('src.connectors.sonarqube_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.sonarqube_client.requests.get')
-    def test_api_request_exception(self, mock_get, mock_secrets):
-        """Test API request exception handling"""
-        # Mock the secrets
-        mock_secrets.side_effect = lambda k: {
-            'SONAR_API_URL': 'http://mock-sonar-url',
-            'SONAR_API_TOKEN': 'mock-token'
-        }[k]
+        assert result['status'] == 'FAILURE'
+        assert "UNKNOWN" in result['message']
 
+    def test_api_request_exception(self, client, mock_get):
+        """Test API request exception handling"""
         # Mock an API exception
-        mock_get.side_effect = requests.exceptions.RequestException('Connection error')
+        mock_get.side_effect = CONN_ERR
 
-        with self.assertRaises(requests.exceptions.RequestException):
-            SonarQubeClient().get_quality_gate_status('mock-project')
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_quality_gate_status('mock-project')
 
-    @patch('src.connectors.sonarqube_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.sonarqube_client.requests.get')
-    def test_api_http_error(self, mock_get, mock_secrets):
+    def test_api_http_error(self, client, mock_get):
         """Test API HTTP error handling"""
-        # Mock the secrets
-        mock_secrets.side_effect = lambda k: {
-            'SONAR_API_URL': 'http://mock-sonar-url',
-            'SONAR_API_TOKEN': 'mock-token'
-        }[k]
-
         # Mock HTTP error
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError('404 Not Found')
-        mock_get.return_value = mock_response
-
-        with self.assertRaises(requests.exceptions.HTTPError):
-            SonarQubeClient().get_quality_gate_status('mock-project')
-
+        mock_get.return_value = JsonResponse(None, status_code=404, error=HTTP_404)
 
-if __name__ == '__main__':
-    unittest.main()
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_quality_gate_status('mock-project')
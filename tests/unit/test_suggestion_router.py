@@ -1,19 +1,28 @@
-import unittest
-from unittest.mock import patch, MagicMock
-import json
 from src import main
+from tests import _json as json
 
-class TestSuggestionRouter(unittest.TestCase):
+# Request bodies, serialized once at import
+_SCALING_EVENT_BODY = json.dumps({
+    "suggestion_type": "kubernetes_scaling",
+    "application": {"name": "test-app", "namespace": "test-namespace"},
+    "deployment_context": {"environment": "dev"}
+})
+_MISSING_TYPE_BODY = json.dumps({"application": {}})
+_UNKNOWN_TYPE_BODY = json.dumps({"suggestion_type": "unknown_type"})
 
-    @patch('src.main.load_config')
-    @patch('src.main.suggestion_engines.scaling_engine')
-    @patch('src.main._check_data_availability')
-    def test_router_success_scaling(self, mock_data_availability, mock_scaling_engine, mock_config):
+# Top-level keys of the enhanced scaling response
+_ENHANCED_RESPONSE_KEYS = frozenset({'suggestion_source', 'data_availability', 'inferred_context', 'suggestion'})
+
+
+class TestSuggestionRouter:
+
+    def test_router_success_scaling(self, mocker):
         """
         Test that the router successfully calls the scaling engine.
         """
-        mock_config.return_value = {}
-        mock_data_availability.return_value = ('no_historical_data', None)
+        mocker.patch('src.main.load_config', return_value={})
+        mocker.patch('src.main._check_data_availability', return_value=('no_historical_data', None))
+        mock_scaling_engine = mocker.patch('src.main.suggestion_engines.scaling_engine')
         mock_scaling_engine.get_suggestion.return_value = {
             "suggestion": {
                 "hpa": {
@@ -35,45 +44,33 @@ class TestSuggestionRouter(unittest.TestCase):
             },
             "suggestion_source": "static"
         }
-        
-        event = {
-            'body': json.dumps({
-                "suggestion_type": "kubernetes_scaling",
-                "application": {"name": "test-app", "namespace": "test-namespace"},
-                "deployment_context": {"environment": "dev"}
-            })
-        }
-        
+
+        event = {'body': _SCALING_EVENT_BODY}
+
         response = main.suggestion_handler(event, None)
-        
-        self.assertEqual(response['statusCode'], 200)
+
+        assert response['statusCode'] == 200
         body = json.loads(response['body'])
         # Check that the enhanced response structure is present
-        self.assertIn('suggestion_source', body)
-        self.assertIn('data_availability', body)
-        self.assertIn('inferred_context', body)
-        self.assertIn('suggestion', body)
+        assert _ENHANCED_RESPONSE_KEYS <= body.keys()
         mock_scaling_engine.get_suggestion.assert_called_once()
 
     def test_router_missing_type(self):
         """
         Test that the router fails if suggestion_type is missing.
         """
-        event = {'body': json.dumps({"application": {}})}
+        event = {'body': _MISSING_TYPE_BODY}
         response = main.suggestion_handler(event, None)
-        self.assertEqual(response['statusCode'], 400)
+        assert response['statusCode'] == 400
         body = json.loads(response['body'])
-        self.assertIn("Missing required key: suggestion_type", body['message'])
+        assert "Missing required key: suggestion_type" in body['message']
 
     def test_router_unknown_type(self):
         """
         Test that the router fails for an unknown suggestion_type.
         """
-        event = {'body': json.dumps({"suggestion_type": "unknown_type"})}
+        event = {'body': _UNKNOWN_TYPE_BODY}
         response = main.suggestion_handler(event, None)
-        self.assertEqual(response['statusCode'], 400)
+        assert response['statusCode'] == 400
         body = json.loads(response['body'])
-        self.assertIn("Unknown suggestion_type", body['message'])
-
-if __name__ == '__main__':
-    unittest.main()
+        assert "Unknown suggestion_type" in body['message']
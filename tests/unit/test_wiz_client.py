@@ -1,27 +1,38 @@
-import unittest
-from unittest.mock import patch, MagicMock
+import pytest
 import requests
+
+from src.connectors import wiz_client
 from src.connectors.wiz_client import WizClient
+from tests._fast_mocks import JsonResponse
+from tests.unit._fakes import CONN_ERR, HTTP_401, build_client
+
+_WIZ_SECRETS = {'WIZ_API_TOKEN': 'test-token', 'WIZ_API_URL': 'https://api.wiz.io'}
+
+
+@pytest.fixture(scope="class")
+def client():
+    """A WizClient for the api.wiz.io test tenant, shared by the tests in a class."""
+    return build_client(WizClient, _WIZ_SECRETS)
+
+
+@pytest.fixture
+def mock_get(mocker):
+    return mocker.patch.object(wiz_client.requests, 'get')
 
 
-class TestWizClient(unittest.TestCase):
+class TestWizClient:
+    """get_cve_status on one client per class; only requests.get is patched per test"""
 
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.wiz_client.requests.get')
-    def test_get_cve_status_success_no_vulnerabilities(self, mock_get, mock_secret):
+    def test_get_cve_status_success_no_vulnerabilities(self, client, mock_get):
         """Test successful CVE status check with no vulnerabilities"""
         # Mock successful response with no vulnerabilities
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"count": 0}
-        mock_get.return_value = mock_response
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        
-        result = WizClient().get_cve_status('test-artifact-id')
-        
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['message'], 'Wiz scan passed. No new critical CVEs found.')
-        
+        mock_get.return_value = JsonResponse({"count": 0})
+
+        result = client.get_cve_status('test-artifact-id')
+
+        assert result['status'] == 'SUCCESS'
+        assert result['message'] == 'Wiz scan passed. No new critical CVEs found.'
+
         mock_get.assert_called_once_with(
             'https://api.wiz.io/api/v1/images',
             params={
@@ -36,103 +47,61 @@ class TestWizClient(unittest.TestCase):
             timeout=10
         )
 
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.wiz_client.requests.get')
-    def test_get_cve_status_vulnerabilities_found(self, mock_get, mock_secret):
+    def test_get_cve_status_vulnerabilities_found(self, client, mock_get):
         """Test CVE status check with vulnerabilities found"""
         # Mock successful response with vulnerabilities
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"count": 3}
-        mock_get.return_value = mock_response
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        
-        result = WizClient().get_cve_status('vulnerable-artifact')
-        
-        self.assertEqual(result['status'], 'FAILURE')
-        self.assertEqual(result['message'], "Wiz found critical vulnerabilities for artifact 'vulnerable-artifact'.")
-
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    def test_get_cve_status_no_token(self, mock_secret):
-        """Test CVE status check without API token"""
-        mock_secret.side_effect = lambda k: None if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        with self.assertRaises(ValueError) as context:
-            WizClient()
-        
-        self.assertEqual(str(context.exception), "Wiz API URL or Token not configured.")
-
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    def test_get_cve_status_no_url(self, mock_secret):
-        """Test CVE status check without API URL"""
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else None
-        with self.assertRaises(ValueError) as context:
-            WizClient()
-        
-        self.assertEqual(str(context.exception), "Wiz API URL or Token not configured.")
+        mock_get.return_value = JsonResponse({"count": 3})
+
+        result = client.get_cve_status('vulnerable-artifact')
 
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.wiz_client.requests.get')
-    @patch('builtins.print')
-    def test_get_cve_status_request_exception(self, mock_print, mock_get, mock_secret):
+        assert result['status'] == 'FAILURE'
+        assert result['message'] == "Wiz found critical vulnerabilities for artifact 'vulnerable-artifact'."
+
+    def test_get_cve_status_request_exception(self, client, mock_get, mock_print):
         """Test CVE status check with request exception"""
         # Mock request exception
-        mock_get.side_effect = requests.exceptions.RequestException('Connection error')
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        with self.assertRaises(requests.exceptions.RequestException):
-            WizClient().get_cve_status('test-artifact-id')
-        
+        mock_get.side_effect = CONN_ERR
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_cve_status('test-artifact-id')
+
         mock_print.assert_called_with("Error fetching Wiz status: Connection error")
 
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.wiz_client.requests.get')
-    @patch('builtins.print')
-    def test_get_cve_status_http_error(self, mock_print, mock_get, mock_secret):
+    def test_get_cve_status_http_error(self, client, mock_get, mock_print):
         """Test CVE status check with HTTP error"""
         # Mock HTTP error
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError('401 Unauthorized')
-        mock_get.return_value = mock_response
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        with self.assertRaises(requests.exceptions.HTTPError):
-            WizClient().get_cve_status('test-artifact-id')
-        
+        mock_get.return_value = JsonResponse(None, status_code=401, error=HTTP_401)
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_cve_status('test-artifact-id')
+
         mock_print.assert_called_with("Error fetching Wiz status: 401 Unauthorized")
 
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    @patch('src.connectors.wiz_client.requests.get')
-    def test_get_cve_status_missing_count_field(self, mock_get, mock_secret):
+    def test_get_cve_status_missing_count_field(self, client, mock_get):
         """Test CVE status check with missing count field in response"""
         # Mock response without count field
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"other_field": "value"}
-        mock_get.return_value = mock_response
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        
-        result = WizClient().get_cve_status('test-artifact-id')
-        
+        mock_get.return_value = JsonResponse({"other_field": "value"})
+
+        result = client.get_cve_status('test-artifact-id')
+
         # Should default to 0 when count is missing
-        self.assertEqual(result['status'], 'SUCCESS')
-        self.assertEqual(result['message'], 'Wiz scan passed. No new critical CVEs found.')
-
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    def test_get_cve_status_empty_token(self, mock_secret):
-        """Test CVE status check with empty API token"""
-        mock_secret.side_effect = lambda k: '' if k == 'WIZ_API_TOKEN' else 'https://api.wiz.io'
-        with self.assertRaises(ValueError) as context:
-            WizClient()
-        
-        self.assertEqual(str(context.exception), "Wiz API URL or Token not configured.")
-
-    @patch('src.connectors.wiz_client.secrets_manager.get_secret_value')
-    def test_get_cve_status_empty_url(self, mock_secret):
-        """Test CVE status check with empty API URL"""
-        mock_secret.side_effect = lambda k: 'test-token' if k == 'WIZ_API_TOKEN' else ''
-        with self.assertRaises(ValueError) as context:
-            WizClient()
-        
-        self.assertEqual(str(context.exception), "Wiz API URL or Token not configured.")
+        assert result['status'] == 'SUCCESS'
+        assert result['message'] == 'Wiz scan passed. No new critical CVEs found.'
+
+
+class TestWizClientInit:
+    """Constructor checks, kept apart from the shared client above"""
 
+    @pytest.mark.parametrize("key, value", [
+        ('WIZ_API_TOKEN', None),
+        ('WIZ_API_URL', None),
+        ('WIZ_API_TOKEN', ''),
+        ('WIZ_API_URL', ''),
+    ], ids=["no_token", "no_url", "empty_token", "empty_url"])
+    def test_missing_configuration(self, mocker, key, value):
+        """Test that initialization fails when the API token or URL is missing or empty"""
+        mocker.patch.object(wiz_client.secrets_manager, 'get_secret_value',
+                            side_effect={**_WIZ_SECRETS, key: value}.__getitem__)
+
+        with pytest.raises(ValueError) as context:
+            WizClient()
 
-if __name__ == '__main__':
-    unittest.main()
+        assert str(context.value) == "Wiz API URL or Token not configured."